@@ -9,6 +9,22 @@ New in this edition
 * Command‑line knobs mirroring *audio_transcoder_cli.py* (`--codec`, `--sr`, `--ch`, `--bitrate`).
 * `split` will fall back to *copy* when `--codec copy` is requested.
 * Joined file inherits the extension you give it (codec inferred automatically).
+* `--engine pcm` decodes the input once into a memory‑mapped PCM cache and cuts
+  sample‑accurate chunks from it (see *pcm_engine.py*; needs NumPy).
+* `join --crossfade MS` re‑encodes only a short window around each seam (with a
+  crossfade) and stream‑copies everything else (WAV/FLAC chunks; lossy chunks
+  need `--codec` for a full decode/encode); mismatched chunks are
+  normalised to the first chunk's format.
+* `join --codec/--sr/--ch/--bitrate` decodes the chunks once and encodes the
+  final deliverable in the same pass – no full‑length intermediate file.
+* Split results are cached by input content + split parameters
+  (see *split_cache.py*); a repeat split hard‑links the cached chunks.
+* `split --follow` tails a recording that is still being written and emits
+  each chunk as soon as its window is complete (streamable formats only:
+  WAV/FLAC/MP3/ADTS‑AAC/Ogg/MPEG‑TS; MP4/M4A needs the finished file).
+* `bench-codecs` encodes a sample window of the real input with every codec
+  preset, reports speed/size/upload estimates and can save the winner as the
+  default for later splits.
 
 Usage
 -----
@@ -19,24 +35,65 @@ Split (re‑encode to FLAC chunks):
 
 Join:
     python chunk_audio.py join recording_chunks/ merged.flac # assemble back
+    python chunk_audio.py join converted/ merged.wav --crossfade 20  # click‑free seams
+    python chunk_audio.py join converted/ final.mp3 --codec mp3 --bitrate 128k --ch 2 --sr 44100
+
+Benchmark codecs on a 60‑s window and make the winner the split default:
+    python chunk_audio.py bench-codecs recording.m4a --bandwidth 5M --write-defaults
 
 Exit status ≠0 signals an error.
 """
 from __future__ import annotations
 
 import argparse
-import shutil
+import json
+import os
 import subprocess
-import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
-from typing import List, NoReturn
+from typing import Iterator, List, Tuple
+
+from .pcm_engine import (
+    DEFAULT_PCM_CACHE_DIR,
+    DEFAULT_PCM_CACHE_MAX_BYTES,
+    PcmCache,
+    build_ffmpeg_encode_cmd,
+    encode_view,
+)
+from .split_cache import SplitCache, add_cache_args, cache_from_args, clear_chunks
+from .utils import fatal, check_ffmpeg, probe_audio, run_ffmpeg, CHUNK_DEFAULT_SECS
 
-from .utils import fatal, check_ffmpeg, CHUNK_DEFAULT_SECS
+ENGINES = ("segment", "pcm")
+FOLLOW_IDLE_TIMEOUT_SECS = 30  # recording is finished once it stops growing this long
+SEAM_WINDOW_SECS = 0.25  # audio re‑encoded on each side of a seam (at least)
+# Codecs whose packets decode independently, so stream‑copied bodies can be
+# spliced sample‑accurately between packets.  Lossy codecs (MDCT overlap,
+# encoder priming/padding per seam clip) cannot.  FLAC frames keep their
+# original frame numbers, so the spliced FLAC stream is decoded (exactly) and
+# re‑encoded in the final pass rather than muxed as is.
+SEAMLESS_CODECS = ("wav", "flac")
 
 DEFAULT_SAMPLE_RATE = 16_000
 DEFAULT_CHANNELS = 1
+# Written by `bench-codecs --write-defaults`, read as split defaults
+SPLIT_DEFAULTS_FILE = (
+    Path(__file__).resolve().parent.parent / "pipeline_data" / "split_defaults.json"
+)
+BENCH_WINDOW_SECS = 60
+BENCH_PRESETS = [
+    {"codec": "flac", "sr": 16_000, "ch": 1, "bitrate": None},
+    {"codec": "wav", "sr": 16_000, "ch": 1, "bitrate": None},
+    {"codec": "opus", "sr": 16_000, "ch": 1, "bitrate": "24k"},
+    {"codec": "opus", "sr": 48_000, "ch": 1, "bitrate": "32k"},
+    {"codec": "mp3", "sr": 16_000, "ch": 1, "bitrate": "32k"},
+    {"codec": "aac", "sr": 16_000, "ch": 1, "bitrate": "32k"},
+    {"codec": "flac", "sr": 44_100, "ch": 1, "bitrate": None},
+    {"codec": "copy", "sr": None, "ch": None, "bitrate": None},
+]
 CODEC_MAP = {
     "flac": {"codec": "flac", "ext": ".flac"},
     "opus": {"codec": "libopus", "ext": ".opus"},
@@ -45,6 +102,14 @@ CODEC_MAP = {
     "aac": {"codec": "aac", "ext": ".m4a"},
     "copy": {"codec": "copy", "ext": None},  # keep orig ext
 }
+# ffprobe decoder name → CODEC_MAP key, used to re‑encode seams in kind
+DECODER_TO_CODEC = {
+    "flac": "flac",
+    "opus": "opus",
+    "pcm_s16le": "wav",
+    "mp3": "mp3",
+    "aac": "aac",
+}
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +177,10 @@ def split_audio(
     channels: int,
     bitrate: str | None,
     verbose: bool,
+    engine: str = "segment",
+    pcm_cache_dir: Path | None = None,
+    cache: SplitCache | None = None,
+    pcm_cache_max_bytes: int = DEFAULT_PCM_CACHE_MAX_BYTES,
 ) -> None:
     if not infile.is_file():
         fatal(f"Input file not found: {infile}")
@@ -119,6 +188,48 @@ def split_audio(
     enc = infer_codec(codec_name)
     outdir.mkdir(parents=True, exist_ok=True)
     suffix = enc["ext"] or infile.suffix  # copy keeps original extension
+
+    copying = enc["codec"] == "copy"
+    params = {
+        "splitter": "audio_chunker",
+        "engine": engine,
+        "chunk": chunk,
+        "codec": enc["codec"],
+        "ext": suffix,
+        "sample_rate": None if copying else sample_rate,
+        "channels": None if copying else channels,
+        "bitrate": None if copying else bitrate,
+    }
+    key = None
+    if cache is not None:
+        key = cache.key(infile, **params)
+        cached = cache.restore(key, outdir, infile.stem)
+        if cached:
+            for p in cached:
+                print(f"  • {p.name}")
+            print(f"✅ {len(cached)} chunk(s) restored from cache → {outdir.resolve()}")
+            return
+
+    # never write into files that may be hard links to a cache entry
+    clear_chunks(outdir, infile.stem)
+
+    if engine == "pcm":
+        chunks = split_audio_pcm(
+            infile,
+            outdir,
+            chunk,
+            enc,
+            sample_rate,
+            channels,
+            bitrate,
+            verbose,
+            pcm_cache_dir,
+            pcm_cache_max_bytes,
+        )
+        if cache is not None:
+            cache.store(key, chunks, params)
+        return
+
     template = outdir / f"{infile.stem}_%03d{suffix}"
 
     cmd = build_ffmpeg_split_cmd(
@@ -161,22 +272,222 @@ def split_audio(
             "No chunks were created – FFmpeg produced no output. Check the codec/format."
         )
 
+    if cache is not None:
+        cache.store(key, chunks, params)
+
     total = timedelta(seconds=len(chunks) * chunk)
     for p in chunks:
         print(f"  • {p.name}")
     print(f"✅ {len(chunks)} chunk(s) written → {outdir.resolve()} (≈{total})")
 
 
+def split_audio_pcm(
+    infile: Path,
+    outdir: Path,
+    chunk: int,
+    enc: dict,
+    sample_rate: int,
+    channels: int,
+    bitrate: str | None,
+    verbose: bool,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = DEFAULT_PCM_CACHE_MAX_BYTES,
+) -> List[Path]:
+    """Split via the memory‑mapped PCM cache: exact chunk lengths, one decode."""
+    if enc["codec"] == "copy":
+        fatal("--codec copy cannot be combined with --engine pcm.")
+
+    pcm = PcmCache.open(
+        infile, sample_rate, channels, cache_dir, verbose, cache_max_bytes
+    )
+    if not len(pcm):
+        fatal("Decoded audio is empty – nothing to split.")
+
+    chunks = []
+    for i, view in enumerate(pcm.chunks(chunk)):
+        out_path = outdir / f"{infile.stem}_{i:03d}{enc['ext']}"
+        encode_view(
+            view,
+            out_path,
+            enc,
+            pcm.sample_rate,
+            pcm.channels,
+            sample_rate,
+            channels,
+            bitrate,
+            verbose,
+        )
+        chunks.append(out_path)
+
+    total = timedelta(seconds=pcm.duration)
+    for p in chunks:
+        print(f"  • {p.name}")
+    print(f"✅ {len(chunks)} chunk(s) written → {outdir.resolve()} ({total})")
+    return chunks
+
+
+def build_ffmpeg_follow_cmd(
+    infile: Path,
+    sample_rate: int,
+    channels: int,
+    idle_timeout: float,
+    verbose: bool,
+) -> List[str]:
+    """Return the FFmpeg command that tails a growing file and decodes it to stdout.
+
+    The ``file`` protocol's ``follow`` option keeps reading as the file grows;
+    ``rw_timeout`` ends the stream once no new data arrived for *idle_timeout*.
+    """
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-follow",
+        "1",
+        "-rw_timeout",
+        str(int(idle_timeout * 1_000_000)),
+        "-i",
+        f"file:{infile}",
+        "-vn",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+
+
+def follow_split(
+    infile: Path,
+    outdir: Path,
+    chunk: int,
+    codec_name: str | None,
+    sample_rate: int,
+    channels: int,
+    bitrate: str | None,
+    verbose: bool,
+    idle_timeout: float = FOLLOW_IDLE_TIMEOUT_SECS,
+    stop: threading.Event | None = None,
+) -> Iterator[Path]:
+    """Yield chunk paths from a file that is still being written, like ``tail -f``.
+
+    The input is decoded as it grows; every time *chunk* seconds of PCM are
+    available that window is encoded and yielded immediately.  Chunks appear
+    atomically (written under a hidden name, then renamed), so a directory
+    watcher never sees a partial file.  The trailing partial window is
+    emitted once the file has stopped growing for *idle_timeout* seconds.
+    If FFmpeg fails, or stops while the file is still growing, fatal() is
+    called instead.  Setting *stop* (from another thread) ends the stream
+    at once, without a trailing chunk.
+    """
+    if not infile.is_file():
+        fatal(f"Input file not found: {infile}")
+    enc = infer_codec(codec_name)
+    if enc["codec"] == "copy":
+        fatal("--codec copy cannot be combined with --follow.")
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    cmd = build_ffmpeg_follow_cmd(infile, sample_rate, channels, idle_timeout, verbose)
+    if verbose:
+        print("[ffmpeg]", " ".join(cmd))
+
+    frame_bytes = channels * 2  # s16le
+    chunk_bytes = chunk * sample_rate * frame_bytes
+    with tempfile.TemporaryFile() as errlog:
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=None if verbose else errlog
+            )
+        except FileNotFoundError:
+            fatal(
+                f"FFmpeg command not found. Ensure FFmpeg is installed and in your PATH. Command: {' '.join(cmd)}"
+            )
+
+        def emit(index: int, pcm: bytes) -> Path:
+            out_path = outdir / f"{infile.stem}_{index:03d}{enc['ext']}"
+            tmp_path = outdir / f".{out_path.name}"
+            encode_view(
+                pcm,
+                tmp_path,
+                enc,
+                sample_rate,
+                channels,
+                sample_rate,
+                channels,
+                bitrate,
+                verbose,
+            )
+            tmp_path.replace(out_path)
+            return out_path
+
+        def watch() -> None:
+            # the blocking read below only returns once FFmpeg exits
+            while proc.poll() is None:
+                if stop.wait(0.2):
+                    proc.kill()
+                    return
+
+        if stop is not None:
+            threading.Thread(target=watch, daemon=True).start()
+
+        index = 0
+        buf = bytearray()
+        try:
+            while True:
+                data = proc.stdout.read(chunk_bytes - len(buf))
+                if not data:
+                    break
+                buf += data
+                if len(buf) == chunk_bytes:
+                    yield emit(index, bytes(buf))
+                    index += 1
+                    buf.clear()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        if stop is not None and stop.is_set():
+            return
+
+        # rw_timeout ends the stream only once the file stopped growing; an
+        # exit while it is still fresh (or gone) means FFmpeg gave up on it
+        try:
+            idle_for = time.time() - infile.stat().st_mtime
+        except OSError:
+            idle_for = 0.0
+        if proc.returncode != 0 or idle_for < idle_timeout / 2:
+            errlog.seek(0)
+            stderr = errlog.read().decode(errors="replace").strip()
+            if proc.returncode:
+                reason = f"failed (exit code {proc.returncode})"
+            else:
+                reason = f"stopped while {infile.name} was still growing"
+            fatal(
+                f"FFmpeg command (follow) {reason}."
+                f"\nCommand: {' '.join(cmd)}"
+                + (f"\nFFmpeg stderr:\n{stderr}" if stderr else "")
+            )
+
+        tail = len(buf) - len(buf) % frame_bytes
+        if tail:
+            yield emit(index, bytes(buf[:tail]))
+
+
 # ---------------------------------------------------------------------------
 # Join helpers
 # ---------------------------------------------------------------------------
 
 
-def build_ffmpeg_join_cmd(list_file: Path, outfile: Path, verbose: bool) -> List[str]:
+def build_ffmpeg_join_cmd(
+    list_file: Path, outfile: Path, verbose: bool, codec: str = "copy"
+) -> List[str]:
     cmd = [
         "ffmpeg",
         "-hide_banner",
         *([] if verbose else ["-loglevel", "error"]),
+        "-y",
         "-f",
         "concat",
         "-safe",
@@ -184,13 +495,453 @@ def build_ffmpeg_join_cmd(list_file: Path, outfile: Path, verbose: bool) -> List
         "-i",
         str(list_file),
         "-c",
-        "copy",
+        codec,
         str(outfile),
     ]
     return cmd
 
 
-def join_audio(indir: Path, outfile: Path, verbose: bool) -> None:
+def build_ffmpeg_seam_cmd(
+    left: Path,
+    right: Path,
+    left_start: int,
+    left_length: int,
+    right_end: int,
+    fade: int,
+    enc: dict,
+    sample_rate: int,
+    channels: int,
+    outfile: Path,
+    verbose: bool,
+) -> List[str]:
+    """Return the FFmpeg command that crossfades the tail of *left* into the head of *right*.
+
+    All positions are sample counts: the clip is *left* from *left_start*
+    (of *left_length*) crossfaded into *right* up to *right_end*, i.e. exactly
+    the samples the stream‑copied bodies leave out.  (The head of *right* is
+    cut after the fade: ``acrossfade`` emits nothing if its second input is
+    trimmed.)
+    """
+    clip_length = left_length - left_start + right_end - fade
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-y",
+        "-i",
+        str(left),
+        "-i",
+        str(right),
+        "-filter_complex",
+        f"[0:a]atrim=start_sample={left_start}[l];"
+        f"[l][1:a]acrossfade=ns={fade}:c1=tri:c2=tri,"
+        f"atrim=end_sample={clip_length}",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        enc["codec"],
+        str(outfile),
+    ]
+
+
+def probe_packet_grid(path: Path, sample_rate: int) -> Tuple[int, int, float]:
+    """Return ``(packet_samples, total_samples, start_seconds)`` of *path*'s audio.
+
+    Stream copy can only cut between packets, so seam windows are snapped to
+    multiples of the packet length.  The total is summed from the packets
+    (demux only, no decode) because container durations are unreliable for
+    segment‑muxed chunks (FLAC chunks carry no sample count).  The start is the
+    first packet's timestamp: segment‑muxed FLAC frames keep their position in
+    the source, and the concat demuxer's in/outpoints are stream timestamps.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "packet=pts_time,duration_time",
+        "-of",
+        "csv=p=0",
+        str(path),
+    ]
+    out = run_ffmpeg(cmd, "probe").stdout.decode()
+    rows = [line.split(",") for line in out.split()]
+    sizes = [round(float(dur) * sample_rate) for _, dur in rows]
+    grid = set(sizes[:-1] or sizes)  # the final packet may be short
+    if len(grid) != 1 or min(grid) <= 0:
+        fatal(
+            f"Cannot determine a fixed packet size for {path}; "
+            "join with --codec to decode and re‑encode instead."
+        )
+    return grid.pop(), sum(sizes), float(rows[0][0])
+
+
+def build_ffmpeg_normalise_cmd(
+    infile: Path,
+    outfile: Path,
+    enc: dict,
+    sample_rate: int,
+    channels: int,
+    verbose: bool,
+) -> List[str]:
+    """Return the FFmpeg command that re‑encodes an odd‑one‑out chunk to the reference format."""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-y",
+        "-i",
+        str(infile),
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        enc["codec"],
+        str(outfile),
+    ]
+
+
+def join_audio_seamless(
+    chunks: List[Path],
+    outfile: Path,
+    crossfade_ms: float,
+    verbose: bool,
+    window: float = SEAM_WINDOW_SECS,
+) -> None:
+    """Join *chunks*, re‑encoding only a window around each seam with a crossfade.
+
+    Everything outside the seam windows is stream‑copied via the concat
+    demuxer's ``inpoint``/``outpoint`` directives, so the cost stays close to
+    a plain ``-c copy`` join.  Those directives cut on packet boundaries, so
+    every cut is snapped to a whole number of packets and the seam clip
+    covers exactly the samples in between — nothing is played twice or
+    dropped.  Only WAV and FLAC chunks qualify (see ``SEAMLESS_CODECS``);
+    FLAC output is re‑encoded from the spliced stream in the same pass.
+    Chunks whose codec/rate/channels differ from the first chunk are
+    re‑encoded to match before joining.
+    """
+    workers = os.cpu_count() or 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        infos = list(pool.map(probe_audio, chunks))
+
+    ref = infos[0]
+    codec_key = DECODER_TO_CODEC.get(ref["codec_name"])
+    if codec_key not in SEAMLESS_CODECS:
+        fatal(
+            f"--crossfade cannot splice '{ref['codec_name']}' chunks sample‑accurately "
+            f"(supported: {', '.join(SEAMLESS_CODECS)}); add --codec "
+            f"{codec_key or 'flac'} to decode and re‑encode the whole join instead."
+        )
+    enc = CODEC_MAP[codec_key]
+    sample_rate, channels = ref["sample_rate"], ref["channels"]
+    suffix = chunks[0].suffix
+    fade = round(crossfade_ms / 1000 * sample_rate)
+    if fade <= 0:
+        fatal("--crossfade must be positive.")
+    # samples re‑encoded at least on each side of a seam; holds the fade
+    want = max(round(window * sample_rate), fade)
+
+    with tempfile.TemporaryDirectory(prefix="join_") as tmp:
+        workdir = Path(tmp)
+        sources = list(chunks)
+
+        def fmt(info: dict) -> tuple:
+            return info["codec_name"], info["sample_rate"], info["channels"]
+
+        def normalise(i: int) -> None:
+            out = workdir / f"norm_{i:03d}{suffix}"
+            run_ffmpeg(
+                build_ffmpeg_normalise_cmd(
+                    chunks[i], out, enc, sample_rate, channels, verbose
+                ),
+                "join",
+            )
+            sources[i] = out
+            infos[i] = probe_audio(out)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            odd = [i for i, info in enumerate(infos) if fmt(info) != fmt(ref)]
+            if odd and verbose:
+                print(f"[join] normalising {len(odd)} chunk(s) to {fmt(ref)}")
+            list(pool.map(normalise, odd))
+            grids = list(pool.map(lambda p: probe_packet_grid(p, sample_rate), sources))
+        packets, lengths, starts = zip(*grids)
+
+        # body of chunk i = samples [heads[i], tails[i]), both on its packet grid
+        last = len(sources) - 1
+        heads = [0] + [-(-want // n) * n for n in packets[1:]]
+        tails = [(lengths[i] - want) // packets[i] * packets[i] for i in range(last)]
+        tails.append(lengths[last])
+        if any(tail < head for head, tail in zip(heads, tails)):
+            fatal(
+                f"Crossfade of {crossfade_ms:g} ms does not fit the shortest chunk; "
+                "use a shorter --crossfade."
+            )
+
+        def seam(i: int) -> Path:
+            out = workdir / f"seam_{i:03d}{suffix}"
+            run_ffmpeg(
+                build_ffmpeg_seam_cmd(
+                    sources[i],
+                    sources[i + 1],
+                    tails[i],
+                    lengths[i],
+                    heads[i + 1],
+                    fade,
+                    enc,
+                    sample_rate,
+                    channels,
+                    out,
+                    verbose,
+                ),
+                "seam",
+            )
+            return out
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            seams = list(pool.map(seam, range(last)))
+
+        list_path = workdir / "concat.txt"
+        with list_path.open("w") as lf:
+            for i, src in enumerate(sources):
+                lf.write(f"file '{src.as_posix()}'\n")
+                if i > 0:
+                    lf.write(f"inpoint {starts[i] + heads[i] / sample_rate:.6f}\n")
+                if i < last:
+                    # half a sample early: the packet starting at the cut is dropped
+                    cut = starts[i] + (tails[i] - 0.5) / sample_rate
+                    lf.write(f"outpoint {cut:.6f}\n")
+                    lf.write(f"file '{seams[i].as_posix()}'\n")
+
+        final = enc["codec"] if codec_key == "flac" else "copy"
+        cmd = build_ffmpeg_join_cmd(list_path, outfile, verbose, final)
+        if verbose:
+            print("[ffmpeg]", " ".join(cmd))
+        run_ffmpeg(cmd, "join")
+
+    print(
+        f"✅ Assembled {len(chunks)} chunks → {outfile.resolve()} "
+        f"({len(chunks) - 1} seam(s) crossfaded, {crossfade_ms:g} ms)"
+    )
+
+
+def channel_layout(channels: int) -> str:
+    """Return the FFmpeg channel layout name for a channel count."""
+    return {1: "mono", 2: "stereo"}.get(channels, f"{channels}c")
+
+
+def build_ffmpeg_transcode_join_cmd(
+    chunks: List[Path],
+    list_file: Path | None,
+    outfile: Path,
+    enc: dict,
+    sample_rate: int,
+    channels: int,
+    bitrate: str | None,
+    crossfade_ms: float | None,
+    verbose: bool,
+) -> List[str]:
+    """Return a single FFmpeg command that joins *chunks* and encodes *outfile*.
+
+    With *list_file* (a concat‑demuxer list of *chunks*, all in one format)
+    the chunks are decoded back to back by one demuxer/decoder, like
+    ``build_ffmpeg_join_cmd``.  Without it every chunk is opened as its own
+    input and resampled to a common rate/layout inside one filter graph, then
+    either concatenated or chained through ``acrossfade``.
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-y",
+    ]
+    if list_file is not None:
+        cmd += ["-f", "concat", "-safe", "0", "-i", str(list_file), "-map", "0:a"]
+    else:
+        for p in chunks:
+            cmd += ["-i", str(p)]
+
+        layout = channel_layout(channels)
+        graph = [
+            f"[{i}:a]aresample={sample_rate},aformat=channel_layouts={layout}[a{i}]"
+            for i in range(len(chunks))
+        ]
+        if crossfade_ms and len(chunks) > 1:
+            fade = crossfade_ms / 1000
+            prev = "a0"
+            for i in range(1, len(chunks)):
+                graph.append(
+                    f"[{prev}][a{i}]acrossfade=d={fade:.6f}:c1=tri:c2=tri[x{i}]"
+                )
+                prev = f"x{i}"
+            out_label = prev
+        else:
+            inputs = "".join(f"[a{i}]" for i in range(len(chunks)))
+            graph.append(f"{inputs}concat=n={len(chunks)}:v=0:a=1[out]")
+            out_label = "out"
+        cmd += ["-filter_complex", ";".join(graph), "-map", f"[{out_label}]"]
+
+    cmd += [
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        enc["codec"],
+    ]
+    if bitrate:
+        cmd += ["-b:a", bitrate]
+    cmd.append(str(outfile))
+    return cmd
+
+
+def join_audio_transcode(
+    chunks: List[Path],
+    outfile: Path,
+    enc: dict,
+    sample_rate: int | None,
+    channels: int | None,
+    bitrate: str | None,
+    crossfade_ms: float | None,
+    verbose: bool,
+) -> None:
+    """Join and encode to the delivery format in one decode/encode pass.
+
+    Chunks are read through the concat demuxer (one input, one decoder) unless
+    ``acrossfade`` needs each chunk as its own input, or the chunks differ in
+    codec/rate/channels, which a single decoder cannot follow.
+    """
+    crossfade = bool(crossfade_ms) and len(chunks) > 1
+    if crossfade:
+        infos = [probe_audio(chunks[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            infos = list(pool.map(probe_audio, chunks))
+    ref = infos[0]
+    sample_rate = sample_rate or ref["sample_rate"]
+    channels = channels or ref["channels"]
+    formats = {(i["codec_name"], i["sample_rate"], i["channels"]) for i in infos}
+
+    with tempfile.TemporaryDirectory(prefix="join_") as tmp:
+        list_file = None
+        if not crossfade and len(formats) == 1:
+            list_file = Path(tmp) / "concat.txt"
+            list_file.write_text("".join(f"file '{p.as_posix()}'\n" for p in chunks))
+        cmd = build_ffmpeg_transcode_join_cmd(
+            chunks,
+            list_file,
+            outfile,
+            enc,
+            sample_rate,
+            channels,
+            bitrate,
+            crossfade_ms,
+            verbose,
+        )
+        if verbose:
+            print("[ffmpeg]", " ".join(cmd))
+        run_ffmpeg(cmd, "join")
+    print(
+        f"✅ Assembled {len(chunks)} chunks → {outfile.resolve()} "
+        f"({enc['codec']}, {sample_rate} Hz, {channels} ch)"
+    )
+
+
+class IncrementalJoiner:
+    """Append converted chunks to one output file as they become available.
+
+    A single long‑running FFmpeg encoder reads raw PCM on stdin; every
+    appended chunk is decoded to that PCM format and streamed in, so the
+    joined file grows with the recording and is finalised by ``close()``.
+    """
+
+    def __init__(
+        self,
+        outfile: Path,
+        codec_name: str | None,
+        sample_rate: int,
+        channels: int,
+        bitrate: str | None = None,
+        verbose: bool = False,
+    ):
+        enc = infer_codec(codec_name or "wav")
+        if enc["codec"] == "copy":
+            fatal("Incremental join needs a real codec, not 'copy'.")
+        self.outfile = outfile
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.verbose = verbose
+        self.count = 0
+        outfile.parent.mkdir(parents=True, exist_ok=True)
+        cmd = build_ffmpeg_encode_cmd(
+            outfile, enc, sample_rate, channels, sample_rate, channels, bitrate, verbose
+        )
+        if verbose:
+            print("[ffmpeg]", " ".join(cmd))
+        self._errlog = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stderr=None if verbose else self._errlog,
+        )
+
+    def append(self, chunk_path: Path) -> None:
+        """Decode *chunk_path* and stream it into the output."""
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            *([] if self.verbose else ["-loglevel", "error"]),
+            "-i",
+            str(chunk_path),
+            "-vn",
+            "-ac",
+            str(self.channels),
+            "-ar",
+            str(self.sample_rate),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ]
+        pcm = run_ffmpeg(cmd, "join").stdout
+        try:
+            self._proc.stdin.write(pcm)
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            self.close()  # reports the encoder's error
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the output file; calls fatal() if the encoder failed."""
+        if self._proc.stdin and not self._proc.stdin.closed:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        if self._proc.wait() != 0:
+            self._errlog.seek(0)
+            stderr = self._errlog.read().decode(errors="replace").strip()
+            fatal(
+                f"FFmpeg command (join) failed (exit code {self._proc.returncode})."
+                + (f"\nFFmpeg stderr:\n{stderr}" if stderr else "")
+            )
+        self._errlog.close()
+
+
+def join_audio(
+    indir: Path,
+    outfile: Path,
+    verbose: bool,
+    crossfade_ms: float | None = None,
+    codec_name: str | None = None,
+    sample_rate: int | None = None,
+    channels: int | None = None,
+    bitrate: str | None = None,
+) -> None:
     if not indir.is_dir():
         fatal(f"Input directory not found: {indir}")
 
@@ -198,6 +949,23 @@ def join_audio(indir: Path, outfile: Path, verbose: bool) -> None:
     if not chunks:
         fatal("No audio chunks found in the specified directory.")
 
+    if codec_name and codec_name != "copy":
+        join_audio_transcode(
+            chunks,
+            outfile,
+            infer_codec(codec_name),
+            sample_rate,
+            channels,
+            bitrate,
+            crossfade_ms,
+            verbose,
+        )
+        return
+
+    if crossfade_ms is not None and len(chunks) > 1:
+        join_audio_seamless(chunks, outfile, crossfade_ms, verbose)
+        return
+
     with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tf:
         for p in chunks:
             tf.write(f"file '{p.as_posix()}'\n")
@@ -233,6 +1001,184 @@ def join_audio(indir: Path, outfile: Path, verbose: bool) -> None:
     print(f"✅ Assembled {len(chunks)} chunks → {outfile.resolve()}")
 
 
+# ---------------------------------------------------------------------------
+# Codec benchmark
+# ---------------------------------------------------------------------------
+
+
+def parse_bandwidth(text: str) -> float:
+    """Parse a bandwidth such as ``10M``, ``500k`` or ``2e6`` into bits/second."""
+    units = {"k": 1e3, "m": 1e6, "g": 1e9}
+    text = text.strip().lower().removesuffix("bps").removesuffix("bit/s")
+    scale = units.get(text[-1:], 1.0)
+    if text[-1:] in units:
+        text = text[:-1]
+    try:
+        value = float(text) * scale
+    except ValueError:
+        fatal(f"Invalid bandwidth: {text!r} (use e.g. 10M or 500k)")
+    if value <= 0:
+        fatal("Bandwidth must be positive.")
+    return value
+
+
+def preset_label(preset: dict) -> str:
+    if preset["codec"] == "copy":
+        return "copy"
+    label = f"{preset['codec']} {preset['sr'] // 1000}k/{preset['ch']}ch"
+    return f"{label} @{preset['bitrate']}" if preset["bitrate"] else label
+
+
+def load_split_defaults(path: Path = SPLIT_DEFAULTS_FILE) -> dict:
+    """Return the saved split defaults (codec/sr/ch/bitrate), or {} if none."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def apply_split_defaults(args: argparse.Namespace, saved: dict) -> None:
+    """Fill the split options the user left unset from the saved bench winner.
+
+    The winner's rate, channels and bit‑rate belong to its codec, so they are
+    only used when the split uses that codec; any other codec gets the stock
+    defaults (and no bit‑rate).
+    """
+    if args.codec is None:
+        args.codec = saved.get("codec")
+    preset = saved if saved and (args.codec or "flac") == saved.get("codec") else {}
+    if args.sr is None:
+        args.sr = preset.get("sr") or DEFAULT_SAMPLE_RATE
+    if args.ch is None:
+        args.ch = preset.get("ch") or DEFAULT_CHANNELS
+    if args.bitrate is None:
+        args.bitrate = preset.get("bitrate")
+
+
+def save_split_defaults(preset: dict, path: Path = SPLIT_DEFAULTS_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    keys = ("codec", "sr", "ch", "bitrate")
+    path.write_text(json.dumps({k: preset[k] for k in keys}, indent=2) + "\n")
+
+
+def bench_codecs(
+    infile: Path,
+    window: float,
+    offset: float,
+    bandwidth_bps: float,
+    min_sample_rate: int,
+    write_defaults: bool,
+    verbose: bool,
+) -> dict:
+    """Encode a window of *infile* with every preset and report the trade‑offs.
+
+    For each preset: encode speed (× realtime, decoding the input included, as
+    in a real split), bytes per audio‑second and the estimated encode + upload
+    time for the *whole* input at *bandwidth_bps*.  The winner is the preset
+    with the lowest estimated total among those whose sample rate (the
+    source's own rate for ``copy``) is at least *min_sample_rate*.
+    """
+    if not infile.is_file():
+        fatal(f"Input file not found: {infile}")
+
+    info = probe_audio(infile)
+    duration = info["duration"]
+    if duration <= 0:
+        fatal(f"Could not determine the duration of {infile}")
+    offset = max(0.0, min(offset, duration - min(window, duration)))
+    window = min(window, duration - offset)
+    quiet = [] if verbose else ["-loglevel", "error"]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        workdir = Path(tmp)
+        for preset in BENCH_PRESETS:
+            enc = CODEC_MAP[preset["codec"]]
+            # every preset reads the window from the real input, so the timing
+            # includes the decode a split of this file would pay
+            cmd = [
+                "ffmpeg",
+                "-hide_banner",
+                *quiet,
+                "-y",
+                "-ss",
+                f"{offset:.3f}",
+                "-t",
+                f"{window:.3f}",
+                "-i",
+                str(infile),
+                "-vn",
+            ]
+            if preset["codec"] == "copy":
+                out = workdir / f"copy{infile.suffix}"
+                cmd += ["-c", "copy"]
+            else:
+                out = workdir / f"{len(results)}{enc['ext']}"
+                cmd += [
+                    "-ac",
+                    str(preset["ch"]),
+                    "-ar",
+                    str(preset["sr"]),
+                    "-c:a",
+                    enc["codec"],
+                ]
+                if preset["bitrate"]:
+                    cmd += ["-b:a", preset["bitrate"]]
+            cmd.append(str(out))
+            if verbose:
+                print("[ffmpeg]", " ".join(cmd))
+
+            started = time.perf_counter()
+            run_ffmpeg(cmd, "bench")
+            elapsed = max(time.perf_counter() - started, 1e-6)
+
+            bytes_per_sec = out.stat().st_size / window
+            encode_total = duration * elapsed / window
+            upload_total = bytes_per_sec * duration * 8 / bandwidth_bps
+            rate = preset["sr"] or info["sample_rate"]  # copy keeps the source rate
+            results.append(
+                {
+                    **preset,
+                    "speed": window / elapsed,
+                    "bytes_per_sec": bytes_per_sec,
+                    "encode_secs": encode_total,
+                    "upload_secs": upload_total,
+                    "total_secs": encode_total + upload_total,
+                    "adequate": rate >= min_sample_rate,
+                }
+            )
+
+    print(
+        f"Benchmark: {window:.0f}s window of {infile.name} "
+        f"(full length {timedelta(seconds=round(duration))}, "
+        f"upload at {bandwidth_bps / 1e6:g} Mbit/s)"
+    )
+    print(
+        f"  {'preset':<22} {'×realtime':>10} {'bytes/s':>10} "
+        f"{'encode':>9} {'upload':>9} {'total':>9}"
+    )
+    for r in results:
+        flag = "" if r["adequate"] else "  (below --min-sr)"
+        print(
+            f"  {preset_label(r):<22} {r['speed']:>10.1f} {r['bytes_per_sec']:>10.0f} "
+            f"{r['encode_secs']:>8.1f}s {r['upload_secs']:>8.1f}s "
+            f"{r['total_secs']:>8.1f}s{flag}"
+        )
+
+    candidates = [r for r in results if r["adequate"]]
+    if not candidates:
+        fatal(f"No preset meets --min-sr {min_sample_rate}.")
+    best = min(candidates, key=lambda r: r["total_secs"])
+    print(
+        f"🏁 Fastest adequate: {preset_label(best)} (≈{best['total_secs']:.1f}s end‑to‑end)"
+    )
+
+    if write_defaults:
+        save_split_defaults(best)
+        print(f"✅ Saved as split defaults → {SPLIT_DEFAULTS_FILE}")
+    return best
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -266,23 +1212,58 @@ def build_parser() -> argparse.ArgumentParser:
     p_split.add_argument(
         "--codec",
         choices=list(CODEC_MAP.keys()),
-        help="Output codec for chunks (default: flac)",
+        help="Output codec for chunks (default: flac, or the saved bench-codecs winner)",
     )
     p_split.add_argument(
         "--sr",
         "--sample-rate",
         type=int,
-        default=DEFAULT_SAMPLE_RATE,
-        help="Sample rate in Hz",
+        help=f"Sample rate in Hz (default: {DEFAULT_SAMPLE_RATE}, or the saved "
+        "winner's when splitting with its codec)",
     )
     p_split.add_argument(
         "--ch",
         "--channels",
         type=int,
-        default=DEFAULT_CHANNELS,
-        help="Number of channels",
+        help=f"Number of channels (default: {DEFAULT_CHANNELS}, or the saved "
+        "winner's when splitting with its codec)",
+    )
+    p_split.add_argument(
+        "--bitrate",
+        help="Bit‑rate for lossy codecs, e.g. 24k (default: the saved winner's "
+        "when splitting with its codec)",
+    )
+    p_split.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="segment",
+        help="segment: FFmpeg segment muxer; pcm: decode once to a memory‑mapped cache and cut sample‑accurate chunks",
+    )
+    p_split.add_argument(
+        "--pcm-cache",
+        type=Path,
+        default=DEFAULT_PCM_CACHE_DIR,
+        help="Directory for the decoded PCM cache",
+    )
+    p_split.add_argument(
+        "--pcm-cache-max-bytes",
+        type=int,
+        default=DEFAULT_PCM_CACHE_MAX_BYTES,
+        help="Evict least‑recently‑used decoded inputs beyond this total size",
+    )
+    add_cache_args(p_split)
+    p_split.add_argument(
+        "--follow",
+        action="store_true",
+        help="Input is still being recorded: emit chunks as each window completes",
+    )
+    p_split.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=FOLLOW_IDLE_TIMEOUT_SECS,
+        metavar="SECONDS",
+        help="With --follow: treat the recording as finished after this long without growth",
     )
-    p_split.add_argument("--bitrate", help="Bit‑rate for lossy codecs, e.g. 24k")
     p_split.add_argument(
         "-v", "--verbose", action="store_true", help="Show FFmpeg output"
     )
@@ -294,6 +1275,72 @@ def build_parser() -> argparse.ArgumentParser:
         "output", type=Path, help="Output re‑assembled file (extension ↔ codec)"
     )
     p_join.add_argument(
+        "--crossfade",
+        type=float,
+        metavar="MS",
+        help="Crossfade each seam over MS milliseconds, re‑encoding only the seam windows "
+        "(WAV/FLAC chunks; combine with --codec for lossy chunks)",
+    )
+    p_join.add_argument(
+        "--codec",
+        choices=list(CODEC_MAP.keys()),
+        help="Encode the joined output in one pass (default: stream copy)",
+    )
+    p_join.add_argument(
+        "--sr",
+        "--sample-rate",
+        type=int,
+        help="Output sample rate in Hz when encoding (default: first chunk's)",
+    )
+    p_join.add_argument(
+        "--ch",
+        "--channels",
+        type=int,
+        help="Output channels when encoding (default: first chunk's)",
+    )
+    p_join.add_argument("--bitrate", help="Bit‑rate for lossy codecs, e.g. 128k")
+    p_join.add_argument(
+        "-v", "--verbose", action="store_true", help="Show FFmpeg output"
+    )
+
+    # bench-codecs
+    p_bench = sub.add_parser(
+        "bench-codecs",
+        help="Benchmark chunk codecs on a sample of the input and pick the fastest adequate one",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    p_bench.add_argument("input", type=Path, help="Input audio file to sample")
+    p_bench.add_argument(
+        "--window",
+        type=float,
+        default=BENCH_WINDOW_SECS,
+        metavar="SECONDS",
+        help="Length of the sample window",
+    )
+    p_bench.add_argument(
+        "--offset",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Where the sample window starts in the input",
+    )
+    p_bench.add_argument(
+        "--bandwidth",
+        default="10M",
+        help="Upload bandwidth for the estimate, in bit/s (e.g. 10M, 500k)",
+    )
+    p_bench.add_argument(
+        "--min-sr",
+        type=int,
+        default=DEFAULT_SAMPLE_RATE,
+        help="Lowest sample rate considered adequate",
+    )
+    p_bench.add_argument(
+        "--write-defaults",
+        action="store_true",
+        help=f"Save the winner as the default for later splits ({SPLIT_DEFAULTS_FILE.name})",
+    )
+    p_bench.add_argument(
         "-v", "--verbose", action="store_true", help="Show FFmpeg output"
     )
 
@@ -306,9 +1353,28 @@ def main() -> None:
     check_ffmpeg()
 
     if args.command == "split":
+        apply_split_defaults(args, load_split_defaults())
         outdir = args.outdir or args.input.with_suffix("").with_name(
             f"{args.input.stem}_chunks"
         )
+        if args.follow:
+            count = 0
+            for p in follow_split(
+                args.input,
+                outdir,
+                args.chunk,
+                args.codec,
+                args.sr,
+                args.ch,
+                args.bitrate,
+                args.verbose,
+                args.idle_timeout,
+            ):
+                count += 1
+                print(f"  • {p.name}", flush=True)
+            print(f"✅ {count} chunk(s) written → {outdir.resolve()}")
+            return
+
         split_audio(
             infile=args.input,
             outdir=outdir,
@@ -318,10 +1384,34 @@ def main() -> None:
             channels=args.ch,
             bitrate=args.bitrate,
             verbose=args.verbose,
+            engine=args.engine,
+            pcm_cache_dir=args.pcm_cache,
+            pcm_cache_max_bytes=args.pcm_cache_max_bytes,
+            cache=cache_from_args(args),
         )
 
     elif args.command == "join":
-        join_audio(args.indir, args.output, args.verbose)
+        join_audio(
+            args.indir,
+            args.output,
+            args.verbose,
+            crossfade_ms=args.crossfade,
+            codec_name=args.codec,
+            sample_rate=args.sr,
+            channels=args.ch,
+            bitrate=args.bitrate,
+        )
+
+    elif args.command == "bench-codecs":
+        bench_codecs(
+            args.input,
+            window=args.window,
+            offset=args.offset,
+            bandwidth_bps=parse_bandwidth(args.bandwidth),
+            min_sample_rate=args.min_sr,
+            write_defaults=args.write_defaults,
+            verbose=args.verbose,
+        )
 
     else:
         parser.error("Unknown command")
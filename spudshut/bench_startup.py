@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py — guard CLI start‑up time against import regressions.
+
+Each SpudShut entry module is imported in a fresh interpreter under
+``python -X importtime``; the cumulative import time of the module's own
+import tree (everything a bare interpreter has not already loaded) is
+reported, best of ``--runs``.  The run fails (exit status 1) if a module
+
+* pulls in a heavy dependency at import time (elevenlabs, tqdm, dotenv,
+  numpy, …) — those belong on the code paths that need them, or
+* exceeds the ``--budget-ms`` import‑time overhead.
+
+Usage
+-----
+    python -m spudshut.bench_startup               # from the repository root
+    python -m spudshut.bench_startup --runs 10 --budget-ms 30
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+ENTRY_MODULES = [
+    "spudshut.convert",
+    "spudshut.audio_chunker",
+    "spudshut.lossless_splitter",
+    "spudshut.pipeline_orchestrator",
+    "spudshut.report",
+]
+FORBIDDEN = {"elevenlabs", "tqdm", "dotenv", "numpy", "httpx", "pydantic"}
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 50.0
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str, module: str) -> Tuple[float, Set[str]]:
+    """Return (cumulative µs of *module* and its packages, imported top‑level names)."""
+    total_us = 0.0
+    packages: Set[str] = set()
+    owners = {
+        ".".join(module.split(".")[: i + 1]) for i in range(module.count(".") + 1)
+    }
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        name = name[1:]  # one space after the separator
+        packages.add(name.strip().split(".")[0])
+        if name in owners:  # top level of the module's own import tree
+            total_us += int(cumulative)
+    return total_us, packages
+
+
+def measure(module: str) -> Tuple[float, Set[str]]:
+    """Import *module* under ``-X importtime`` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(
+            f"Error: importing {module} failed (exit code {proc.returncode})."
+        )
+    return parse_importtime(proc.stderr, module)
+
+
+def bench(modules: List[str], runs: int) -> Dict[str, Tuple[float, Set[str]]]:
+    """Return ``{module: (import_ms, heavy_packages)}``, best of *runs*."""
+    results = {}
+    for mod in modules:
+        best = None
+        heavy: Set[str] = set()
+        for _ in range(runs):
+            total_us, packages = measure(mod)
+            heavy |= packages & FORBIDDEN
+            best = total_us if best is None else min(best, total_us)
+        results[mod] = (best / 1000, heavy)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="bench_startup.py",
+        description="Measure import‑time overhead of the SpudShut CLIs and fail on regressions.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "modules", nargs="*", default=ENTRY_MODULES, help="Modules to import"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=DEFAULT_RUNS, help="Runs per module"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Maximum import time of each module's own import tree",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for mod, (overhead_ms, heavy) in bench(args.modules, max(1, args.runs)).items():
+        status = "ok"
+        if heavy:
+            status = f"FAIL imports {', '.join(sorted(heavy))}"
+            failed = True
+        elif overhead_ms > args.budget_ms:
+            status = f"FAIL over {args.budget_ms:g} ms budget"
+            failed = True
+        print(f"{mod:<30} {overhead_ms:8.1f} ms  {status}")
+
+    if failed:
+        sys.exit(1)
+    print("✅ Start‑up within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,16 @@ Features
 * Saves output files with **identical basenames** (new extension inferred from
   --output-format) in <output_dir> to avoid name clashes.
 * Provides **--list-voices** utility to print all available voice names/IDs.
+* **Multi‑voice fan‑out**: pass several voices to ``--voice``; every
+  (chunk × voice) conversion goes through one shared worker pool, each chunk
+  is read from disk once, and results land in ``<output_dir>/<voice>/``.
+* Optional **request hedging** (``--hedge``): once a request has been running
+  longer than the run's observed latency percentile, one duplicate request is
+  sent; the first success wins and the other is cancelled.  ``--hedge-budget``
+  caps the extra requests as a fraction of the batch.
+* Optional **upload transcoding** (``--upload-codec flac|opus``): each chunk is
+  re‑encoded to compact mono 16 kHz speech audio in a worker pool, ahead of
+  the requests that need it, so fewer bytes go over the wire.
 * Mirrors naming/flag style of `chunk_audio.py`.
 
 Install deps:
@@ -27,39 +37,88 @@ python voice_convert_chunks.py --list-voices
 # Convert folder to Rachel's voice, opus output @48 kHz (≈64 kbps)
 python voice_convert_chunks.py chunks/ rachel_chunks/ \
     --voice "Rachel" --output-format opus_48000_64 --model eleven_multilingual_sts_v2
+
+# Render the same chunks in three voices at once (→ out/Rachel, out/Adam, …)
+python voice_convert_chunks.py --input-dir chunks/ --output-dir out/ \
+    --voice Rachel Adam Bella --workers 6
 ```
 """
 from __future__ import annotations
 
 import argparse
+import io
+import math
 import os
+import queue
 import re
-import sys
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, NoReturn
-
-from tqdm import tqdm  # progress bar
-from elevenlabs.client import ElevenLabs
-from elevenlabs import save
-import dotenv
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from .utils import fatal  # Import from utils
+from .utils import check_ffmpeg, fatal  # Import from utils
 
-dotenv.load_dotenv()
+# elevenlabs, tqdm and dotenv are imported on the code paths that use them so
+# that --help, argument errors and orchestrator probes start instantly.
+if TYPE_CHECKING:
+    from elevenlabs.client import ElevenLabs
 
 DEFAULT_MODEL = "eleven_multilingual_sts_v2"
 DEFAULT_OUTPUT_FORMAT = (
     "wav"  # ElevenLabs short‑codes, e.g. wav, mp3_44100_128, opus_48000_64
 )
+DEFAULT_WORKERS = 4  # concurrent speech‑to‑speech requests
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_BUDGET = 0.05  # extra requests, as a fraction of the batch
+DEFAULT_HEDGE_MIN_SAMPLES = 5  # completed requests before hedging kicks in
+HEDGE_POLL_SECS = 0.5  # re-check interval while the hedge threshold is unknown
+# Upload transcoding: compact, speech‑appropriate formats piped out of FFmpeg
+UPLOAD_FORMATS = {
+    "flac": {"codec": "flac", "muxer": "flac", "ext": ".flac", "bitrate": None},
+    "opus": {"codec": "libopus", "muxer": "ogg", "ext": ".ogg", "bitrate": "32k"},
+}
+DEFAULT_UPLOAD_SAMPLE_RATE = 16_000
+DEFAULT_UPLOAD_CHANNELS = 1
+
+
+def create_client(api_key: str | None = None) -> ElevenLabs:
+    """
+    Loads .env, picks the API key and returns an ElevenLabs client.
 
+    Args:
+        api_key (str | None): Explicit key, used if ELEVENLABS_API_KEY is unset.
 
-def resolve_voice_id(client: ElevenLabs, ident: str) -> str:
+    Returns:
+        ElevenLabs: The client instance.
+
+    Raises:
+        SystemExit: If no API key is available.
+    """
+    import dotenv
+
+    dotenv.load_dotenv()
+
+    env_key = os.getenv("ELEVENLABS_API_KEY")
+    if not env_key:
+        if not api_key:
+            fatal("ELEVENLABS_API_KEY is not set")
+        env_key = api_key
+
+    from elevenlabs.client import ElevenLabs
+
+    return ElevenLabs(api_key=env_key)
+
+
+def resolve_voice_id(client: ElevenLabs, ident: str, voices: list | None = None) -> str:
     """
     Resolves a voice identifier (name or ID) to a valid voice ID.
 
     Args:
         client (ElevenLabs): The ElevenLabs client instance.
         ident (str): The voice identifier (can be a name or an ID).
+        voices (list | None): Pre‑fetched voice list; fetched on demand if None.
 
     Returns:
         str: The resolved voice ID.
@@ -72,7 +131,8 @@ def resolve_voice_id(client: ElevenLabs, ident: str) -> str:
         return ident  # assume already an ID
 
     # otherwise search by name (case‑insensitive)
-    voices = client.voices.get_all().voices  # type: ignore[attr-defined]
+    if voices is None:
+        voices = client.voices.get_all().voices  # type: ignore[attr-defined]
     for v in voices:
         if v.name.lower() == ident.lower():
             return v.voice_id  # type: ignore[attr-defined]
@@ -80,6 +140,28 @@ def resolve_voice_id(client: ElevenLabs, ident: str) -> str:
     fatal(f"Voice name '{ident}' not found. Available voices: {names}")
 
 
+def resolve_voice_ids(client: ElevenLabs, idents: List[str]) -> List[str]:
+    """
+    Resolves several voice identifiers, fetching the voice list at most once.
+
+    Args:
+        client (ElevenLabs): The ElevenLabs client instance.
+        idents (List[str]): Voice names and/or IDs.
+
+    Returns:
+        List[str]: The resolved voice IDs, in the same order.
+    """
+    voices = None
+    if any(not re.fullmatch(r"[A-Za-z0-9]{10,}", i) for i in idents):
+        voices = client.voices.get_all().voices  # type: ignore[attr-defined]
+    return [resolve_voice_id(client, i, voices) for i in idents]
+
+
+def voice_dirname(ident: str) -> str:
+    """Returns a filesystem‑safe directory name for a voice name or ID."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", ident).strip("_") or "voice"
+
+
 # ---------------------------------------------------------------------------
 # Conversion
 # ---------------------------------------------------------------------------
@@ -100,6 +182,183 @@ def ext_from_output_format(fmt: str) -> str:
     return mapping.get(root, ".wav")
 
 
+class HedgeCancelled(Exception):
+    """Raised inside a request that lost the race to its hedged twin."""
+
+
+def fetch_conversion(
+    client: ElevenLabs,
+    voice_id: str,
+    name: str,
+    data: bytes,
+    model_id: str,
+    output_format: str,
+    cancel: threading.Event | None = None,
+) -> bytes:
+    """
+    Runs one speech-to-speech request and returns the converted audio bytes.
+
+    The response is streamed; if *cancel* is set while streaming, the
+    response is closed and HedgeCancelled is raised.
+
+    Args:
+        client (ElevenLabs): The ElevenLabs client instance.
+        voice_id (str): The ID of the target voice.
+        name (str): File name sent with the upload.
+        data (bytes): Input audio content.
+        model_id (str): The ID of the speech-to-speech model to use.
+        output_format (str): The desired output format string.
+        cancel (threading.Event | None): Set to abandon the request.
+
+    Returns:
+        bytes: The converted audio.
+    """
+    f = io.BytesIO(data)
+    f.name = name
+    stream = client.speech_to_speech.convert(  # type: ignore[attr-defined]
+        voice_id=voice_id,
+        audio=f,
+        model_id=model_id,
+        output_format=output_format,
+    )
+    if isinstance(stream, (bytes, bytearray)):
+        return bytes(stream)
+    buf = bytearray()
+    for piece in stream:
+        if cancel is not None and cancel.is_set():
+            close = getattr(stream, "close", None)
+            if close:
+                close()  # drops the HTTP response
+            raise HedgeCancelled()
+        buf += piece
+    return bytes(buf)
+
+
+class Hedger:
+    """
+    Issues at most one duplicate request for slow conversions.
+
+    Latencies of successful requests in this run are recorded; once at least
+    ``min_samples`` are known, a request still running after the
+    ``percentile``-th latency gets a twin.  The first successful attempt wins
+    and the other is cancelled.  Duplicates are capped at ``budget`` × the
+    number of tasks in the batch (rounded up).
+
+    Attempts run on daemon threads and losers are never joined: a request
+    that hangs before returning any bytes cannot be interrupted, but it no
+    longer holds up the caller or interpreter exit.
+    """
+
+    def __init__(
+        self,
+        total_tasks: int,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        budget: float = DEFAULT_HEDGE_BUDGET,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+    ):
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.max_extra = math.ceil(budget * total_tasks) if budget > 0 else 0
+        self.extra = 0
+        self.wins = 0
+        self._latencies: List[float] = []
+        self._inflight: set[threading.Event] = set()
+        self._lock = threading.Lock()
+
+    def threshold(self) -> float | None:
+        """Returns the current hedge delay in seconds, or None while warming up."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self.extra >= self.max_extra:
+                return False
+            self.extra += 1
+            return True
+
+    def run(self, attempt: Callable[[threading.Event], bytes]) -> bytes:
+        """
+        Runs *attempt*, hedging it once if it exceeds the latency threshold.
+
+        The threshold is re-read while the primary is running, so requests
+        that started during warm-up can still be hedged.  The latency recorded
+        for the task is the one the caller saw (from the primary's start),
+        never a twin's own, shorter, duration.
+
+        Args:
+            attempt (Callable[[threading.Event], bytes]): Performs one request;
+                should give up when the passed event is set.
+
+        Returns:
+            bytes: The result of the first successful attempt.
+        """
+        results: "queue.Queue[Tuple[int, bytes | None, Exception | None]]"
+        results = queue.Queue()
+        cancels: List[threading.Event] = []
+
+        def launch() -> None:
+            index, cancel = len(cancels), threading.Event()
+            cancels.append(cancel)
+            with self._lock:
+                self._inflight.add(cancel)
+
+            def target() -> None:
+                try:
+                    results.put((index, attempt(cancel), None))
+                except Exception as exc:
+                    results.put((index, None, exc))
+                finally:
+                    with self._lock:
+                        self._inflight.discard(cancel)
+
+            threading.Thread(target=target, daemon=True).start()
+
+        started = time.monotonic()
+        launch()
+        may_hedge = self.max_extra > 0
+        errors: List[Exception] = []
+        while len(errors) < len(cancels):
+            timeout = None
+            if may_hedge:
+                delay = self.threshold()
+                timeout = (
+                    HEDGE_POLL_SECS
+                    if delay is None
+                    else max(0.0, started + delay - time.monotonic())
+                )
+            try:
+                index, result, exc = results.get(timeout=timeout)
+            except queue.Empty:
+                delay = self.threshold()
+                if delay is not None and time.monotonic() - started >= delay:
+                    may_hedge = False
+                    if self._spend():
+                        launch()
+                continue
+            if exc is not None:
+                errors.append(exc)
+                continue
+            for cancel in cancels:
+                cancel.set()  # losers stop at their next streamed piece
+            with self._lock:
+                self._latencies.append(time.monotonic() - started)
+                if index != 0:
+                    self.wins += 1
+            return result
+        raise errors[0]
+
+    def close(self) -> None:
+        """Signals every attempt still in flight to give up."""
+        with self._lock:
+            for cancel in self._inflight:
+                cancel.set()
+
+
 def convert_file(
     client: ElevenLabs,
     voice_id: str,
@@ -107,6 +366,9 @@ def convert_file(
     out_path: Path,
     model_id: str,
     output_format: str,
+    data: bytes | None = None,
+    hedger: Optional["Hedger"] = None,
+    upload_name: str | None = None,
 ):
     """
     Converts a single audio file to a different voice using ElevenLabs speech-to-speech.
@@ -118,19 +380,289 @@ def convert_file(
         out_path (Path): Path to save the converted audio file.
         model_id (str): The ID of the speech-to-speech model to use.
         output_format (str): The desired output format string for the converted audio.
+        data (bytes | None): Already‑loaded content of *in_path*; read from disk if None.
+        hedger (Hedger | None): When given, the request is hedged (see ``Hedger``).
+        upload_name (str | None): File name sent with *data* (default: in_path.name).
 
     Returns:
         None
     """
-    with in_path.open("rb") as f:
-        audio_stream = client.speech_to_speech.convert(  # type: ignore[attr-defined]
-            voice_id=voice_id,
-            audio=f,
-            model_id=model_id,
-            output_format=output_format,
+    if data is None:
+        data = in_path.read_bytes()
+    upload_name = upload_name or in_path.name
+    if hedger is not None:
+        audio = hedger.run(
+            lambda cancel: fetch_conversion(
+                client, voice_id, upload_name, data, model_id, output_format, cancel
+            )
         )
-        # `audio_stream` can be bytes or an iterator; `save` handles both
-        save(audio_stream, out_path.as_posix())
+        out_path.write_bytes(audio)
+        return
+
+    from elevenlabs import save
+
+    f = io.BytesIO(data)
+    f.name = upload_name  # lets the SDK infer filename/MIME type
+    audio_stream = client.speech_to_speech.convert(  # type: ignore[attr-defined]
+        voice_id=voice_id,
+        audio=f,
+        model_id=model_id,
+        output_format=output_format,
+    )
+    # `audio_stream` can be bytes or an iterator; `save` handles both
+    save(audio_stream, out_path.as_posix())
+
+
+class ConversionTask(NamedTuple):
+    """One (chunk × voice) unit of work."""
+
+    in_path: Path
+    voice: str
+    voice_id: str
+    out_path: Path
+
+
+def transcode_for_upload(
+    in_path: Path, fmt: dict, sample_rate: int, channels: int
+) -> bytes:
+    """
+    Re‑encodes a chunk to a compact upload format, entirely in memory.
+
+    Args:
+        in_path (Path): Source chunk.
+        fmt (dict): Entry of ``UPLOAD_FORMATS`` (optionally with a custom bitrate).
+        sample_rate (int): Target sample rate in Hz.
+        channels (int): Target channel count.
+
+    Returns:
+        bytes: The encoded audio.
+
+    Raises:
+        RuntimeError: If FFmpeg fails; the chunk is then reported as failed.
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(in_path),
+        "-vn",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        fmt["codec"],
+    ]
+    if fmt["bitrate"]:
+        cmd += ["-b:a", fmt["bitrate"]]
+    cmd += ["-f", fmt["muxer"], "pipe:1"]
+    proc = subprocess.run(cmd, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"FFmpeg transcode failed (exit code {proc.returncode}): "
+            f"{proc.stderr.decode(errors='replace').strip()}"
+        )
+    return proc.stdout
+
+
+class SharedChunks:
+    """
+    Loads each input chunk at most once and shares its bytes between voices.
+
+    Every chunk is registered with the number of tasks that need it; its bytes
+    are dropped as soon as the last of those tasks releases it.  Loading
+    (a plain read, or a transcode when *load* is given) runs on a small pool
+    and is started *lookahead* chunks ahead of the requests, so it overlaps
+    with network I/O while memory stays bounded by the chunks in flight.
+    """
+
+    def __init__(
+        self,
+        uses: Dict[Path, int],
+        order: List[Path],
+        load: Callable[[Path], bytes] | None = None,
+        workers: int = 2,
+        lookahead: int = 0,
+    ):
+        self._uses = dict(uses)
+        self._order = order
+        self._index = {p: i for i, p in enumerate(order)}
+        self._load = load or Path.read_bytes
+        self._lookahead = lookahead
+        self._futures: Dict[Path, "Future[bytes]"] = {}
+        self._guard = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers))
+
+    def _ensure(self, path: Path) -> "Future[bytes]":
+        # caller holds self._guard
+        fut = self._futures.get(path)
+        if fut is None:
+            fut = self._pool.submit(self._load, path)
+            self._futures[path] = fut
+        return fut
+
+    def acquire(self, path: Path) -> bytes:
+        with self._guard:
+            fut = self._ensure(path)
+            start = self._index[path] + 1
+            for nxt in self._order[start : start + self._lookahead]:
+                if self._uses.get(nxt, 0) > 0:
+                    self._ensure(nxt)
+        return fut.result()
+
+    def release(self, path: Path) -> None:
+        with self._guard:
+            self._uses[path] -= 1
+            if self._uses[path] <= 0:
+                self._futures.pop(path, None)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def pending_inputs(
+    input_files: List[Path], output_dir: Path, ext: str, overwrite: bool
+) -> Tuple[List[Path], int]:
+    """
+    Splits input files into those still needing conversion and a skip count.
+
+    Args:
+        input_files (List[Path]): All candidate input files.
+        output_dir (Path): Where converted files for one voice are written.
+        ext (str): Output file extension.
+        overwrite (bool): Re‑process files that already have an output.
+
+    Returns:
+        Tuple[List[Path], int]: Files to process and the number skipped.
+    """
+    from tqdm import tqdm
+
+    if overwrite:
+        return list(input_files), 0
+
+    existing_output_stems = set()
+    if output_dir.exists():
+        for f_out in output_dir.glob(f"*{ext}"):
+            if f_out.is_file():
+                existing_output_stems.add(f_out.stem)
+
+    to_process: List[Path] = []
+    skipped = 0
+    for in_path_candidate in input_files:
+        if in_path_candidate.stem in existing_output_stems:
+            tqdm.write(
+                f"Skipping existing (pre-scan): {output_dir.name}/{in_path_candidate.stem}{ext}"
+            )
+            skipped += 1
+        else:
+            to_process.append(in_path_candidate)
+    return to_process, skipped
+
+
+def run_conversions(
+    client: ElevenLabs,
+    tasks: List[ConversionTask],
+    model_id: str,
+    output_format: str,
+    workers: int,
+    hedger: Hedger | None = None,
+    upload: dict | None = None,
+    transcode_workers: int | None = None,
+    latencies: List[float] | None = None,
+) -> List[Tuple[ConversionTask, Exception]]:
+    """
+    Runs all (chunk × voice) tasks through one shared thread pool.
+
+    Tasks are submitted chunk‑major so every voice of a chunk runs close
+    together and the chunk's bytes can be released early.
+
+    Args:
+        client (ElevenLabs): The ElevenLabs client instance (thread‑safe).
+        tasks (List[ConversionTask]): Work items.
+        model_id (str): Speech‑to‑speech model ID.
+        output_format (str): ElevenLabs output format string.
+        workers (int): Maximum concurrent requests.
+        hedger (Hedger | None): Hedge slow requests when given.
+        upload (dict | None): Upload transcoding settings (``format``,
+            ``sample_rate``, ``channels``); chunks are uploaded as‑is if None.
+        transcode_workers (int | None): Size of the load/transcode pool.
+        latencies (List[float] | None): When given, the request time (seconds,
+            chunk load excluded) of every successful conversion is appended;
+            their sum is the job's ``api_seconds`` for ``update_job_status``.
+
+    Returns:
+        List[Tuple[ConversionTask, Exception]]: Tasks that failed, with their error.
+    """
+    from tqdm import tqdm
+
+    uses: Dict[Path, int] = {}
+    order: List[Path] = []
+    for t in tasks:
+        if t.in_path not in uses:
+            order.append(t.in_path)
+        uses[t.in_path] = uses.get(t.in_path, 0) + 1
+
+    load = None
+    prep_workers = 2
+    if upload is not None:
+        fmt = upload["format"]
+
+        def load(path: Path) -> bytes:
+            return transcode_for_upload(
+                path, fmt, upload["sample_rate"], upload["channels"]
+            )
+
+        prep_workers = transcode_workers or os.cpu_count() or 2
+    # prefetch as many chunks as the in-flight requests span, so buffered
+    # bytes track request concurrency (--workers), not the CPU count
+    voices = max(1, len(tasks) // max(1, len(order)))
+    lookahead = -(-max(1, workers) // voices)
+    chunks = SharedChunks(uses, order, load, workers=prep_workers, lookahead=lookahead)
+
+    def run(task: ConversionTask) -> None:
+        upload_name = None
+        if upload is not None:
+            upload_name = task.in_path.stem + upload["format"]["ext"]
+        try:
+            data = chunks.acquire(task.in_path)
+            started = time.monotonic()
+            convert_file(
+                client,
+                task.voice_id,
+                task.in_path,
+                task.out_path,
+                model_id,
+                output_format,
+                data=data,
+                hedger=hedger,
+                upload_name=upload_name,
+            )
+            if latencies is not None:
+                latencies.append(time.monotonic() - started)
+        finally:
+            chunks.release(task.in_path)
+
+    failures: List[Tuple[ConversionTask, Exception]] = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(run, t): t for t in tasks}
+            for fut in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Converting",
+                unit="file",
+            ):
+                task = futures[fut]
+                try:
+                    fut.result()
+                except Exception as exc:  # keep the rest of the batch going
+                    tqdm.write(f"Failed: {task.voice}/{task.in_path.name}: {exc}")
+                    failures.append((task, exc))
+    finally:
+        chunks.close()
+    return failures
 
 
 # ---------------------------------------------------------------------------
@@ -158,13 +690,74 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--output-dir", type=Path, help="Directory to write converted chunks"
     )
-    p.add_argument("--voice", "-v", required=False, help="Target voice name or ID")
+    p.add_argument(
+        "--voice",
+        "-v",
+        nargs="+",
+        required=False,
+        help="Target voice name(s) or ID(s); several voices write to <output_dir>/<voice>/",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Concurrent conversions shared across all voices",
+    )
     p.add_argument("--model", default=DEFAULT_MODEL, help="Model ID to use")
     p.add_argument(
         "--output-format",
         default=DEFAULT_OUTPUT_FORMAT,
         help="ElevenLabs output_format string",
     )
+    p.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send one duplicate request for conversions slower than --hedge-percentile",
+    )
+    p.add_argument(
+        "--hedge-percentile",
+        type=float,
+        default=DEFAULT_HEDGE_PERCENTILE,
+        help="Latency percentile (learned from this run) after which a request is hedged",
+    )
+    p.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=DEFAULT_HEDGE_BUDGET,
+        help="Maximum extra requests as a fraction of the batch size",
+    )
+    p.add_argument(
+        "--hedge-min-samples",
+        type=int,
+        default=DEFAULT_HEDGE_MIN_SAMPLES,
+        help="Completed requests needed before hedging starts",
+    )
+    p.add_argument(
+        "--upload-codec",
+        choices=list(UPLOAD_FORMATS.keys()),
+        help="Transcode chunks to this compact format before upload (default: upload as‑is)",
+    )
+    p.add_argument(
+        "--upload-sr",
+        type=int,
+        default=DEFAULT_UPLOAD_SAMPLE_RATE,
+        help="Sample rate of transcoded uploads in Hz",
+    )
+    p.add_argument(
+        "--upload-ch",
+        type=int,
+        default=DEFAULT_UPLOAD_CHANNELS,
+        help="Channels of transcoded uploads",
+    )
+    p.add_argument(
+        "--upload-bitrate",
+        help="Bit‑rate for lossy upload codecs (default: 32k for opus)",
+    )
+    p.add_argument(
+        "--transcode-workers",
+        type=int,
+        help="Parallel FFmpeg transcodes feeding the uploads (default: CPU count)",
+    )
     p.add_argument(
         "--api-key", help="Explicit ElevenLabs API key (else env ELEVENLABS_API_KEY)"
     )
@@ -184,8 +777,9 @@ def main() -> None:
     Main function to handle argument parsing, voice listing, and file conversion.
 
     Reads command-line arguments, lists voices if requested, or performs batch
-    conversion of audio files in the input directory to the specified voice,
-    saving them to the output directory.
+    conversion of audio files in the input directory to the specified voice(s),
+    saving them to the output directory (one subdirectory per voice when
+    several voices are given).
 
     Args:
         None
@@ -198,13 +792,19 @@ def main() -> None:
     """
     args = build_parser().parse_args()
 
-    api_key = os.getenv("ELEVENLABS_API_KEY")
-    if not api_key:
-        if not args.api_key:
-            fatal("ELEVENLABS_API_KEY is not set")
-        api_key = args.api_key
-
-    client = ElevenLabs(api_key=api_key)
+    # --- Conversion Mode ---
+    # Validate before touching the environment or the (slow to import) SDK
+    if not args.list_voices:
+        if not args.input_dir:
+            fatal("--input-dir is required for conversion mode.")
+        if not args.output_dir:
+            fatal("--output-dir is required for conversion mode.")
+        if not args.voice:
+            fatal("--voice is required for conversion mode.")
+        if not args.input_dir.is_dir():
+            fatal(f"Input directory not found: {args.input_dir}")
+
+    client = create_client(args.api_key)
 
     # Handle --list-voices mode first, as it doesn't need other args
     if args.list_voices:
@@ -216,75 +816,108 @@ def main() -> None:
         print("----------------------------")
         return
 
-    # --- Conversion Mode ---
-    # These arguments are required if not listing voices
-    if not args.input_dir:
-        fatal("--input-dir is required for conversion mode.")
-    if not args.output_dir:
-        fatal("--output-dir is required for conversion mode.")
-    if not args.voice:
-        fatal("--voice is required for conversion mode.")
-
-    if not args.input_dir.is_dir():
-        fatal(f"Input directory not found: {args.input_dir}")
-
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    voice_id = resolve_voice_id(client, args.voice)
+    args.voice = list(dict.fromkeys(args.voice))  # drop duplicate voices
+    voice_ids = resolve_voice_ids(client, args.voice)
     ext = ext_from_output_format(args.output_format)
 
-    # Get all potential input files
+    # Get all potential input files (scanned once for every voice)
     all_input_files = sorted(p for p in args.input_dir.iterdir() if p.is_file())
     if not all_input_files:
         fatal(f"No audio files found in {args.input_dir.resolve()}.")
 
-    files_to_process: List[Path] = []
+    multi_voice = len(args.voice) > 1
+    tasks_by_voice: List[List[ConversionTask]] = []
     skipped_count = 0
+    output_dirs: List[Path] = []
+    for voice, voice_id in zip(args.voice, voice_ids):
+        out_dir = (
+            args.output_dir / voice_dirname(voice) if multi_voice else args.output_dir
+        )
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output_dirs.append(out_dir)
+        to_process, skipped = pending_inputs(
+            all_input_files, out_dir, ext, args.overwrite
+        )
+        skipped_count += skipped
+        tasks_by_voice.append(
+            [
+                ConversionTask(p, voice, voice_id, out_dir / (p.stem + ext))
+                for p in to_process
+            ]
+        )
 
-    if args.overwrite:
-        files_to_process = all_input_files
-    else:
-        existing_output_stems = set()
-        if args.output_dir.exists():
-            for f_out in args.output_dir.glob(f"*{ext}"):
-                if f_out.is_file():
-                    existing_output_stems.add(f_out.stem)
-
-        for in_path_candidate in all_input_files:
-            if in_path_candidate.stem in existing_output_stems:
-                tqdm.write(
-                    f"Skipping existing (pre-scan): {in_path_candidate.stem}{ext}"
-                )
-                skipped_count += 1
-            else:
-                files_to_process.append(in_path_candidate)
+    # chunk‑major order: all voices of chunk 0, then chunk 1, ...
+    order = {p: i for i, p in enumerate(all_input_files)}
+    tasks = sorted(
+        (t for voice_tasks in tasks_by_voice for t in voice_tasks),
+        key=lambda t: order[t.in_path],
+    )
 
-    if not files_to_process:
+    if not tasks:
         message = f"No files to process. All {len(all_input_files)} input file(s) seem "
-        if args.output_dir.exists():
-            message += f"to have corresponding outputs with '{ext}' extension in {args.output_dir.resolve()}."
-        else:
-            message += f"as output directory {args.output_dir.resolve()} does not exist or is empty."
-        if not args.overwrite and len(all_input_files) > 0:
+        message += f"to have corresponding outputs with '{ext}' extension in "
+        message += ", ".join(str(d.resolve()) for d in output_dirs) + "."
+        if not args.overwrite:
             message += " Use --overwrite to re-process."
         print(message)
         return
 
-    for in_path in tqdm(files_to_process, desc="Converting", unit="file"):
-        out_filename = in_path.stem + ext
-        out_path = args.output_dir / out_filename
-        # The pre-scan logic handles skipping if not overwriting.
-        # If overwriting, all files are in files_to_process.
-        convert_file(
-            client, voice_id, in_path, out_path, args.model, args.output_format
+    upload = None
+    if args.upload_codec:
+        check_ffmpeg()
+        fmt = dict(UPLOAD_FORMATS[args.upload_codec])
+        if args.upload_bitrate:
+            fmt["bitrate"] = args.upload_bitrate
+        upload = {
+            "format": fmt,
+            "sample_rate": args.upload_sr,
+            "channels": args.upload_ch,
+        }
+
+    hedger = None
+    if args.hedge:
+        hedger = Hedger(
+            len(tasks),
+            args.hedge_percentile,
+            args.hedge_budget,
+            args.hedge_min_samples,
         )
+    latencies: List[float] = []
+    try:
+        failures = run_conversions(
+            client,
+            tasks,
+            args.model,
+            args.output_format,
+            args.workers,
+            hedger,
+            upload,
+            args.transcode_workers,
+            latencies,
+        )
+    finally:
+        if hedger is not None:
+            hedger.close()
 
-    processed_count = len(files_to_process)
+    processed_count = len(tasks) - len(failures)
     summary_message = f"✅ Processed {processed_count} file(s)"
+    if multi_voice:
+        summary_message += f" across {len(args.voice)} voices"
     if skipped_count > 0:
         summary_message += f", skipped {skipped_count} existing file(s)"
-    summary_message += f". Output → {args.output_dir.resolve()}"
+    summary_message += ". Output → " + ", ".join(str(d.resolve()) for d in output_dirs)
     print(summary_message)
+    if latencies:
+        print(f"API time: {sum(latencies):.1f}s over {len(latencies)} request(s).")
+    if hedger is not None:
+        print(
+            f"Hedged {hedger.extra} request(s) (budget {hedger.max_extra}); "
+            f"{hedger.wins} duplicate(s) finished first."
+        )
+    if failures:
+        fatal(f"{len(failures)} conversion(s) failed; rerun to retry them.")
 
 
 if __name__ == "__main__":
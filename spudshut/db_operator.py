@@ -4,9 +4,12 @@ Handles all SQLite database operations for the audio processing pipeline.
 """
 from __future__ import annotations
 
+import math
 import sqlite3
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional  # Corrected Optional import
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 # Define the database file path relative to this script or a defined data directory
 # For now, assuming it will be in pipeline_data/ relative to project root
@@ -15,24 +18,163 @@ DATABASE_FILE = (
     Path(__file__).resolve().parent.parent / "pipeline_data" / "audio_pipeline.db"
 )
 
+MEDIA_METADATA_COLUMNS = (
+    "path",
+    "size",
+    "mtime_ns",
+    "duration",
+    "codec_name",
+    "sample_rate",
+    "channels",
+    "bit_rate",
+    "format_name",
+    "error",
+    "probed_at",
+)
+
+
+def get_connection() -> sqlite3.Connection:
+    """Opens the pipeline database (WAL mode, rows as sqlite3.Row)."""
+    DATABASE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DATABASE_FILE, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+@contextmanager
+def connect() -> Iterator[sqlite3.Connection]:
+    """Yields a connection that commits on success, rolls back on error and closes."""
+    conn = get_connection()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
 
 def initialize_database():
-    """Creates the processing_jobs table if it doesn't exist."""
-    # pass # TODO: Implement
+    """Creates the processing_jobs and stage_events tables if they don't exist."""
+    with connect() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS processing_jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_filename TEXT NOT NULL,
+                job_identifier TEXT UNIQUE NOT NULL,
+                status TEXT NOT NULL,
+                input_file_path TEXT,
+                chunks_dir_path TEXT,
+                converted_chunks_dir_path TEXT,
+                output_file_path TEXT,
+                audio_seconds REAL,
+                last_updated TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                error_message TEXT
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_processing_jobs_status"
+            " ON processing_jobs (status)"
+        )
+        # Append-only log of status transitions. prev_status / elapsed_seconds
+        # refer to the job's last non-PENDING_* event and audio_seconds is
+        # copied from the job, so every report metric is an index-only range
+        # scan over idx_stage_events_window - no joins, no table lookups.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stage_events (
+                event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER NOT NULL REFERENCES processing_jobs (job_id),
+                status TEXT NOT NULL,
+                prev_status TEXT,
+                event_time REAL NOT NULL,
+                elapsed_seconds REAL,
+                api_seconds REAL,
+                audio_seconds REAL,
+                error_message TEXT
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_stage_events_window"
+            " ON stage_events (status, event_time, prev_status,"
+            " elapsed_seconds, api_seconds, audio_seconds)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_stage_events_job"
+            " ON stage_events (job_id, event_time)"
+        )
+    initialize_media_metadata()  # events copy durations of indexed input files
+
+
+def _append_stage_event(
+    conn: sqlite3.Connection,
+    job_id: int,
+    status: str,
+    error_message: Optional[str] = None,
+    api_seconds: Optional[float] = None,
+) -> None:
+    """Logs a status transition of *job_id* inside the caller's transaction."""
+    now = time.time()
+    anchor = conn.execute(
+        "SELECT status, event_time FROM stage_events"
+        " WHERE job_id = ? AND status NOT LIKE 'PENDING%'"
+        " ORDER BY event_time DESC, event_id DESC LIMIT 1",
+        (job_id,),
+    ).fetchone()
+    prev_status = anchor["status"] if anchor else None
+    elapsed = now - anchor["event_time"] if anchor else None
+    conn.execute(
+        """
+        INSERT INTO stage_events (job_id, status, prev_status, event_time,
+            elapsed_seconds, api_seconds, audio_seconds, error_message)
+        SELECT ?, ?, ?, ?, ?, ?, COALESCE(j.audio_seconds, m.duration), ?
+        FROM processing_jobs j
+        LEFT JOIN media_metadata m ON m.path = j.input_file_path
+        WHERE j.job_id = ?
+        """,
+        (job_id, status, prev_status, now, elapsed, api_seconds, error_message, job_id),
+    )
 
 
 def add_new_job(
-    original_filename: str, job_identifier: str, input_file_path: str
+    original_filename: str,
+    job_identifier: str,
+    input_file_path: str,
+    audio_seconds: Optional[float] = None,
 ) -> Optional[int]:  # Return Optional[int] for job_id
     """Adds a new file to the database with status 'NEW'. Returns the job_id or None on failure."""
-    # pass # TODO: Implement
-    return None
+    try:
+        with connect() as conn:
+            cur = conn.execute(
+                "INSERT INTO processing_jobs (original_filename, job_identifier,"
+                " status, input_file_path, audio_seconds) VALUES (?, ?, 'NEW', ?, ?)",
+                (original_filename, job_identifier, input_file_path, audio_seconds),
+            )
+            _append_stage_event(conn, cur.lastrowid, "NEW")
+            return cur.lastrowid
+    except sqlite3.IntegrityError:  # duplicate job_identifier
+        return None
+
 
+def update_job_status(
+    job_id: int, new_status: str, api_seconds: Optional[float] = None
+) -> bool:
+    """
+    Updates the status and last_updated timestamp and logs the transition.
 
-def update_job_status(job_id: int, new_status: str) -> bool:
-    """Updates the status and last_updated timestamp. Returns True on success."""
-    # pass # TODO: Implement
-    return False
+    ``api_seconds`` optionally records the time spent in API requests during
+    the stage that just finished (e.g. summed request latency on CONVERTED).
+    Returns True on success.
+    """
+    with connect() as conn:
+        cur = conn.execute(
+            "UPDATE processing_jobs SET status = ?, last_updated = CURRENT_TIMESTAMP"
+            " WHERE job_id = ?",
+            (new_status, job_id),
+        )
+        if cur.rowcount == 0:
+            return False
+        _append_stage_event(conn, job_id, new_status, api_seconds=api_seconds)
+    return True
 
 
 def update_job_paths(
@@ -42,26 +184,55 @@ def update_job_paths(
     output_file: Optional[str] = None,
 ) -> bool:
     """Updates path fields as stages complete. Returns True on success."""
-    # pass # TODO: Implement
-    return False
+    fields = {
+        "chunks_dir_path": chunks_dir,
+        "converted_chunks_dir_path": converted_chunks_dir,
+        "output_file_path": output_file,
+    }
+    updates = {k: v for k, v in fields.items() if v is not None}
+    if not updates:
+        return False
+    assignments = ", ".join(f"{k} = ?" for k in updates)
+    with connect() as conn:
+        cur = conn.execute(
+            f"UPDATE processing_jobs SET {assignments},"
+            " last_updated = CURRENT_TIMESTAMP WHERE job_id = ?",
+            (*updates.values(), job_id),
+        )
+        return cur.rowcount > 0
 
 
 def log_job_error(job_id: int, error_msg: str) -> bool:
     """Sets status to 'ERROR' and records the error message. Returns True on success."""
-    # pass # TODO: Implement
-    return False
+    with connect() as conn:
+        cur = conn.execute(
+            "UPDATE processing_jobs SET status = 'ERROR', error_message = ?,"
+            " last_updated = CURRENT_TIMESTAMP WHERE job_id = ?",
+            (error_msg, job_id),
+        )
+        if cur.rowcount == 0:
+            return False
+        _append_stage_event(conn, job_id, "ERROR", error_message=error_msg)
+    return True
 
 
 def get_jobs_by_status(status: str) -> List[Dict[str, Any]]:
     """Retrieves all jobs with a specific status. Returns a list of job data."""
-    # pass # TODO: Implement
-    return []
+    with connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM processing_jobs WHERE status = ? ORDER BY job_id",
+            (status,),
+        )
+        return [dict(row) for row in rows]
 
 
 def get_job_details(job_id: int) -> Optional[Dict[str, Any]]:
     """Retrieves all details for a specific job. Returns job data or None if not found."""
-    # pass # TODO: Implement
-    return None
+    with connect() as conn:
+        row = conn.execute(
+            "SELECT * FROM processing_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return dict(row) if row else None
 
 
 def check_if_job_exists(
@@ -72,8 +243,229 @@ def check_if_job_exists(
     For now, can check by original_filename and a recent 'COMPLETED' status.
     Returns True if a similar completed job exists, False otherwise.
     """
-    # pass # TODO: Implement
-    return False
+    with connect() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM processing_jobs"
+            " WHERE original_filename = ? AND status = 'COMPLETED' LIMIT 1",
+            (original_filename,),
+        ).fetchone()
+        return row is not None
+
+
+# ---------------------------------------------------------------------------
+# Media metadata index (see media_index.py)
+# ---------------------------------------------------------------------------
+
+
+def initialize_media_metadata() -> None:
+    """Creates the media_metadata table (ffprobe results keyed by path) if needed."""
+    with connect() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS media_metadata (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                duration REAL,
+                codec_name TEXT,
+                sample_rate INTEGER,
+                channels INTEGER,
+                bit_rate INTEGER,
+                format_name TEXT,
+                error TEXT,
+                probed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_media_metadata_codec"
+            " ON media_metadata (codec_name)"
+        )
+
+
+def get_media_metadata(paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Returns the stored metadata rows for *paths*, keyed by path."""
+    found: Dict[str, Dict[str, Any]] = {}
+    with connect() as conn:
+        # stay well below SQLite's bound-parameter limit
+        for i in range(0, len(paths), 500):
+            batch = paths[i : i + 500]
+            marks = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT * FROM media_metadata WHERE path IN ({marks})", batch
+            )
+            found.update({row["path"]: dict(row) for row in rows})
+    return found
+
+
+def upsert_media_metadata(rows: List[Dict[str, Any]]) -> None:
+    """Inserts or replaces metadata rows in a single transaction."""
+    if not rows:
+        return
+    columns = MEDIA_METADATA_COLUMNS[:-1]  # probed_at uses the default
+    marks = ",".join("?" * len(columns))
+    with connect() as conn:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO media_metadata ({','.join(columns)})"
+            f" VALUES ({marks})",
+            [tuple(row.get(c) for c in columns) for row in rows],
+        )
+
+
+def query_media_metadata(
+    directory: Optional[str] = None,
+    codec_name: Optional[str] = None,
+    min_duration: Optional[float] = None,
+    max_duration: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Returns indexed files matching all given filters, ordered by path.
+
+    ``directory`` matches everything below that (absolute) directory using a
+    primary-key range scan rather than LIKE.
+    """
+    clauses, params = ["error IS NULL"], []
+    if directory:
+        prefix = directory.rstrip("/") + "/"
+        clauses.append("path >= ? AND path < ?")
+        params += [prefix, prefix[:-1] + "0"]  # '0' sorts right after '/'
+    if codec_name:
+        clauses.append("codec_name = ?")
+        params.append(codec_name)
+    if min_duration is not None:
+        clauses.append("duration >= ?")
+        params.append(min_duration)
+    if max_duration is not None:
+        clauses.append("duration <= ?")
+        params.append(max_duration)
+    sql = f"SELECT * FROM media_metadata WHERE {' AND '.join(clauses)} ORDER BY path"
+    with connect() as conn:
+        return [dict(row) for row in conn.execute(sql, params)]
+
+
+def delete_media_metadata(paths: List[str]) -> int:
+    """Removes index rows for *paths* (e.g. deleted files). Returns rows removed."""
+    with connect() as conn:
+        cur = conn.executemany(
+            "DELETE FROM media_metadata WHERE path = ?", [(p,) for p in paths]
+        )
+        return cur.rowcount
+
+
+# ---------------------------------------------------------------------------
+# Job history analytics (see report.py)
+# ---------------------------------------------------------------------------
+
+
+def get_stage_events(job_id: int) -> List[Dict[str, Any]]:
+    """Returns the logged status transitions of one job, oldest first."""
+    with connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM stage_events WHERE job_id = ?"
+            " ORDER BY event_time, event_id",
+            (job_id,),
+        )
+        return [dict(row) for row in rows]
+
+
+def count_transitions(
+    status: str, prev_status: Optional[str], since: float, until: float
+) -> int:
+    """Counts events entering *status* (from *prev_status*, if given) in [since, until)."""
+    sql = "SELECT COUNT(*) FROM stage_events"
+    sql += " WHERE status = ? AND event_time >= ? AND event_time < ?"
+    params: List[Any] = [status, since, until]
+    if prev_status is not None:
+        sql += " AND prev_status = ?"
+        params.append(prev_status)
+    with connect() as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def transition_durations(
+    status: str,
+    prev_status: str,
+    since: float,
+    until: float,
+    percentiles: Tuple[float, ...] = (50, 95),
+) -> Dict[str, Any]:
+    """
+    Summarises ``elapsed_seconds`` of *prev_status* → *status* transitions.
+
+    Returns ``count``, ``total``, ``mean`` and ``p<N>`` for each percentile
+    (nearest rank), from one sorted scan of the covering index.
+    """
+    with connect() as conn:
+        values = [
+            row[0]
+            for row in conn.execute(
+                "SELECT elapsed_seconds FROM stage_events"
+                " WHERE status = ? AND event_time >= ? AND event_time < ?"
+                " AND prev_status = ? AND elapsed_seconds IS NOT NULL"
+                " ORDER BY elapsed_seconds",
+                (status, since, until, prev_status),
+            )
+        ]
+    count, total = len(values), math.fsum(values)
+    stats: Dict[str, Any] = {
+        "count": count,
+        "total": total,
+        "mean": total / count if count else None,
+    }
+    for pct in percentiles:
+        rank = max(1, math.ceil(pct / 100 * count))
+        stats[f"p{pct:g}"] = values[rank - 1] if count else None
+    return stats
+
+
+def stage_audio_seconds(
+    status: str, prev_status: str, since: float, until: float
+) -> Dict[str, float]:
+    """
+    Returns elapsed, API and audio seconds of *prev_status* → *status* transitions.
+
+    ``elapsed`` and ``audio`` cover all ``count`` transitions; ``audio`` is the
+    job's ``audio_seconds`` or, failing that, the indexed duration of its input
+    file at the time of the event.  ``api`` sums the recorded ``api_seconds``
+    and ``api_audio`` the audio of just those ``api_count`` transitions, so
+    the two form a ratio without mixing in stage wall time.
+    """
+    with connect() as conn:
+        row = conn.execute(
+            "SELECT TOTAL(elapsed_seconds), TOTAL(audio_seconds), COUNT(*),"
+            " TOTAL(api_seconds),"
+            " TOTAL(CASE WHEN api_seconds IS NOT NULL THEN audio_seconds END),"
+            " COUNT(api_seconds)"
+            " FROM stage_events WHERE status = ? AND event_time >= ?"
+            " AND event_time < ? AND prev_status = ?",
+            (status, since, until, prev_status),
+        ).fetchone()
+    keys = ("elapsed", "audio", "count", "api", "api_audio", "api_count")
+    return dict(zip(keys, row))
+
+
+def audio_throughput(
+    since: float, until: float, bucket_seconds: int = 3600
+) -> List[Dict[str, Any]]:
+    """
+    Returns completed jobs and audio seconds per time bucket in [since, until).
+
+    Buckets are aligned to multiples of *bucket_seconds* since the epoch
+    (UTC hours by default); empty buckets are omitted.
+    """
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT CAST(event_time / :bucket AS INTEGER) * :bucket AS bucket_start,
+                   COUNT(*) AS jobs,
+                   TOTAL(audio_seconds) AS audio_seconds
+            FROM stage_events
+            WHERE status = 'COMPLETED'
+              AND event_time >= :since AND event_time < :until
+            GROUP BY bucket_start
+            ORDER BY bucket_start
+            """,
+            {"bucket": bucket_seconds, "since": since, "until": until},
+        )
+        return [dict(row) for row in rows]
 
 
 # Example usage (for testing, can be removed later)
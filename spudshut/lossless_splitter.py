@@ -11,6 +11,8 @@ Some users reported "it runs but nothing happens."  This edition adds:
 • Auto‑creates the output directory next to the input file if `--outdir` isn't
   given.
 • Prints a per‑chunk summary so you immediately see work being done.
+• Re‑splitting the same input with the same chunk length reuses (hard‑links)
+  the cached chunk set instead of running FFmpeg again (`--no-cache` to skip).
 
 Dependencies
 ------------
@@ -29,13 +31,12 @@ Exit status ≠0 means something went wrong.
 from __future__ import annotations
 
 import argparse
-import shutil
 import subprocess
-import sys
 from datetime import timedelta
 from pathlib import Path
-from typing import List, NoReturn
+from typing import List
 
+from .split_cache import SplitCache, add_cache_args, cache_from_args, clear_chunks
 from .utils import fatal, check_ffmpeg, CHUNK_DEFAULT_SECS  # Import from utils
 
 
@@ -61,11 +62,32 @@ def build_ffmpeg_cmd(
     ]
 
 
-def split_audio(infile: Path, outdir: Path, chunk: int, verbose: bool) -> None:
+def split_audio(
+    infile: Path,
+    outdir: Path,
+    chunk: int,
+    verbose: bool,
+    cache: SplitCache | None = None,
+) -> None:
     if not infile.is_file():
         fatal(f"Input file not found: {infile}")
 
     outdir.mkdir(parents=True, exist_ok=True)
+
+    params = {"splitter": "lossless", "chunk": chunk, "ext": infile.suffix}
+    key = None
+    if cache is not None:
+        key = cache.key(infile, **params)
+        cached = cache.restore(key, outdir, infile.stem)
+        if cached:
+            for p in cached:
+                print(f"  • {p.name}")
+            print(f"✅ {len(cached)} chunk(s) restored from cache → {outdir.resolve()}")
+            return
+
+    # never write into files that may be hard links to a cache entry
+    clear_chunks(outdir, infile.stem)
+
     template = outdir / f"{infile.stem}_%03d{infile.suffix}"
 
     cmd = build_ffmpeg_cmd(infile, template, chunk, verbose)
@@ -100,6 +122,9 @@ def split_audio(infile: Path, outdir: Path, chunk: int, verbose: bool) -> None:
             "No chunks were created – FFmpeg produced no output. Check the codec/format."
         )
 
+    if cache is not None:
+        cache.store(key, chunks, params)
+
     total = timedelta(seconds=len(chunks) * chunk)
     for i, p in enumerate(chunks, 1):
         print(f"  • {p.name}")
@@ -129,6 +154,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Show FFmpeg output"
     )
+    add_cache_args(parser)
     return parser.parse_args()
 
 
@@ -141,7 +167,7 @@ def main() -> None:
         f"{args.input.stem}_chunks"
     )
 
-    split_audio(args.input, outdir, args.chunk, args.verbose)
+    split_audio(args.input, outdir, args.chunk, args.verbose, cache_from_args(args))
 
 
 if __name__ == "__main__":
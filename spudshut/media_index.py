@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+media_index.py — parallel, cached ffprobe metadata for pipeline files.
+
+Files are probed with a bounded thread pool and the results (duration, codec,
+sample rate, channels, bit‑rate, container) are stored in the job database's
+``media_metadata`` table, keyed by absolute path and validated against the
+file's size + mtime.  Repeat lookups over thousands of inputs and chunks are
+answered from the index; only new or modified files are probed again.
+
+Usage
+-----
+    python -m spudshut.media_index scan pipeline_input/ pipeline_processing/
+    python -m spudshut.media_index query --dir pipeline_processing --codec flac
+    python -m spudshut.media_index query --min-duration 600
+
+Library use::
+
+    from spudshut import media_index
+    meta = media_index.lookup(Path("pipeline_input/talk.m4a"))
+    seconds = media_index.total_duration(chunk_paths)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import db_operator
+from .utils import fatal, probe_audio
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def probe_metadata(path: Path) -> Dict[str, Any]:
+    """
+    Probes *path* (``utils.probe_audio``) and returns an index row (without size/mtime).
+
+    Failures are returned as a row with ``error`` set rather than raised, so
+    unreadable files are remembered and not re‑probed until they change.
+    """
+    info = probe_audio(path, strict=False)
+    if info["error"]:
+        return {"error": info["error"]}
+    # probe_audio reports unknown numbers as 0; the index stores NULL
+    for key in ("duration", "sample_rate", "channels"):
+        info[key] = info[key] or None
+    return info
+
+
+def index_paths(
+    paths: Iterable[Path], workers: int = DEFAULT_WORKERS
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns metadata for every existing file in *paths*, keyed by absolute path.
+
+    Rows whose stored size and mtime match the file are served from the
+    database; the rest are probed in parallel (at most *workers* ffprobe
+    processes) and written back in one transaction.
+    """
+    stats = {}
+    for p in paths:
+        p = Path(p).resolve()
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        stats[str(p)] = (st.st_size, st.st_mtime_ns)
+    if not stats:
+        return {}
+
+    db_operator.initialize_media_metadata()
+    cached = db_operator.get_media_metadata(list(stats))
+    result: Dict[str, Dict[str, Any]] = {}
+    stale: List[str] = []
+    for key, (size, mtime_ns) in stats.items():
+        row = cached.get(key)
+        if row and row["size"] == size and row["mtime_ns"] == mtime_ns:
+            result[key] = row
+        else:
+            stale.append(key)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            probed = list(pool.map(lambda k: probe_metadata(Path(k)), stale))
+        rows = []
+        for key, meta in zip(stale, probed):
+            size, mtime_ns = stats[key]
+            rows.append({"path": key, "size": size, "mtime_ns": mtime_ns, **meta})
+        db_operator.upsert_media_metadata(rows)
+        result.update({row["path"]: row for row in rows})
+    return result
+
+
+def lookup(path: Path) -> Optional[Dict[str, Any]]:
+    """Returns the (possibly freshly probed) metadata row for one file."""
+    return index_paths([path]).get(str(Path(path).resolve()))
+
+
+def total_duration(paths: Iterable[Path], workers: int = DEFAULT_WORKERS) -> float:
+    """Returns the summed duration in seconds of all readable files in *paths*."""
+    rows = index_paths(paths, workers).values()
+    return sum(r["duration"] or 0.0 for r in rows if not r.get("error"))
+
+
+def iter_files(directories: Iterable[Path]) -> List[Path]:
+    """Lists files below *directories*, skipping hidden files and cache folders."""
+    files = []
+    for d in directories:
+        if d.is_file():
+            files.append(d)
+            continue
+        if not d.is_dir():
+            fatal(f"Directory not found: {d}")
+        for root, dirnames, filenames in os.walk(d):
+            dirnames[:] = [n for n in dirnames if not n.startswith(".")]
+            files += [Path(root) / f for f in filenames if not f.startswith(".")]
+    return files
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="media_index.py",
+        description="Index audio metadata (ffprobe) into the pipeline database and query it.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_scan = sub.add_parser("scan", help="Probe new/changed files below directories")
+    p_scan.add_argument("paths", type=Path, nargs="+", help="Directories or files")
+    p_scan.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Concurrent ffprobe processes",
+    )
+
+    p_query = sub.add_parser("query", help="List indexed files from the database")
+    p_query.add_argument("--dir", type=Path, help="Only files below this directory")
+    p_query.add_argument("--codec", help="Only this codec (ffprobe name, e.g. flac)")
+    p_query.add_argument("--min-duration", type=float, metavar="SECONDS")
+    p_query.add_argument("--max-duration", type=float, metavar="SECONDS")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.command == "scan":
+        files = iter_files(args.paths)
+        rows = index_paths(files, args.workers)
+        failed = [r for r in rows.values() if r.get("error")]
+        seconds = sum(r["duration"] or 0.0 for r in rows.values() if not r.get("error"))
+        print(
+            f"✅ Indexed {len(rows)} file(s), {len(failed)} unreadable, "
+            f"total {timedelta(seconds=round(seconds))}"
+        )
+        for r in failed:
+            print(f"  ✗ {r['path']}: {r['error'].splitlines()[0]}")
+
+    elif args.command == "query":
+        db_operator.initialize_media_metadata()
+        rows = db_operator.query_media_metadata(
+            directory=str(args.dir.resolve()) if args.dir else None,
+            codec_name=args.codec,
+            min_duration=args.min_duration,
+            max_duration=args.max_duration,
+        )
+        for r in rows:
+            print(
+                f"{timedelta(seconds=round(r['duration'] or 0))!s:>9}  "
+                f"{r['codec_name'] or '?':<10} {r['sample_rate'] or 0:>6} Hz "
+                f"{r['channels'] or 0} ch  {r['path']}"
+            )
+        total = sum(r["duration"] or 0.0 for r in rows)
+        print(f"{len(rows)} file(s), total {timedelta(seconds=round(total))}")
+
+
+if __name__ == "__main__":
+    main()
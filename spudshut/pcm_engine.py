@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+pcm_engine.py — decode an input file *once* into a memory‑mapped raw PCM cache
+and cut sample‑accurate chunks out of it without going back through FFmpeg's
+decoder.
+
+How it works
+------------
+* The input is decoded to signed 16‑bit little‑endian PCM (``.s16le``) at the
+  requested sample rate/channel count under ``pipeline_data/pcm_cache/<key>/``.
+  The key hashes the source fingerprint (path, size, mtime) with the rate and
+  channels, so a changed input is decoded afresh and same‑stem inputs
+  (``talk.m4a``/``talk.wav``) never collide.  Entries use the split cache's
+  manifest layout and its size‑bounded LRU eviction (``SplitCache.evict``).
+* The cache is opened with ``numpy.memmap``; chunks are plain slices of that
+  array, i.e. zero‑copy views onto the page cache.
+* Views are only encoded when a file is actually needed: WAV is written
+  straight from the view, every other codec is piped through FFmpeg's stdin.
+
+Re‑chunking with a different ``--chunk`` length, silence analysis or seam
+processing can reuse the same cache instead of paying for another decode.
+
+Requires NumPy (``pip install spudshut[pcm]``).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import wave
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from .split_cache import MANIFEST, SplitCache
+from .utils import fatal, run_ffmpeg
+
+np = None  # NumPy is optional and slow to import; loaded by require_numpy()
+
+SAMPLE_WIDTH = 2  # bytes per sample (s16le)
+DEFAULT_PCM_CACHE_DIR = (
+    Path(__file__).resolve().parent.parent / "pipeline_data" / "pcm_cache"
+)
+DEFAULT_PCM_CACHE_MAX_BYTES = 10 * 1024**3  # ≈ 90 h of 16 kHz mono
+PCM_FILE = "audio.s16le"
+
+
+def require_numpy() -> None:
+    """Import NumPy on first use, exiting with a helpful message if it is missing."""
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        fatal("The PCM engine requires NumPy – install it with `pip install numpy`.")
+    np = numpy
+
+
+def _source_fingerprint(infile: Path, sample_rate: int, channels: int) -> dict:
+    st = infile.stat()
+    return {
+        "source": str(infile.resolve()),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sample_rate": sample_rate,
+        "channels": channels,
+    }
+
+
+def _cache_key(fingerprint: dict) -> str:
+    blob = json.dumps(fingerprint, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def build_ffmpeg_decode_cmd(
+    infile: Path, outfile: Path, sample_rate: int, channels: int, verbose: bool
+) -> List[str]:
+    """Return the FFmpeg command that decodes *infile* to raw s16le PCM."""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-y",
+        "-i",
+        str(infile),
+        "-vn",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        "pcm_s16le",
+        "-f",
+        "s16le",
+        str(outfile),
+    ]
+
+
+class PcmCache:
+    """A decoded, memory‑mapped view of an audio file.
+
+    ``frames`` is a read‑only ``(n_frames, channels)`` int16 array backed by
+    the cache file; every slice taken from it is a view, not a copy.
+    """
+
+    def __init__(self, path: Path, sample_rate: int, channels: int):
+        require_numpy()
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        if path.stat().st_size == 0:
+            self.frames = np.zeros((0, channels), dtype="<i2")
+        else:
+            self.frames = np.memmap(path, dtype="<i2", mode="r").reshape(-1, channels)
+
+    @classmethod
+    def open(
+        cls,
+        infile: Path,
+        sample_rate: int,
+        channels: int,
+        cache_dir: Path | None = None,
+        verbose: bool = False,
+        max_bytes: int = DEFAULT_PCM_CACHE_MAX_BYTES,
+    ) -> "PcmCache":
+        """Return the cache for *infile*, decoding it first if not cached yet.
+
+        After a decode, least‑recently‑used entries are evicted until the
+        cache fits *max_bytes* (the entry just decoded is always kept).
+        """
+        require_numpy()
+        cache_dir = cache_dir or DEFAULT_PCM_CACHE_DIR
+        fingerprint = _source_fingerprint(infile, sample_rate, channels)
+        key = _cache_key(fingerprint)
+        entry = cache_dir / key
+        pcm_path, manifest = entry / PCM_FILE, entry / MANIFEST
+
+        if manifest.is_file() and pcm_path.is_file():
+            os.utime(manifest)  # mark as recently used
+            if verbose:
+                print(f"[pcm] reusing decoded cache {pcm_path}")
+            return cls(pcm_path, sample_rate, channels)
+
+        entry.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry / f"{PCM_FILE}.{os.getpid()}.part"
+        cmd = build_ffmpeg_decode_cmd(infile, tmp_path, sample_rate, channels, verbose)
+        if verbose:
+            print("[ffmpeg]", " ".join(cmd))
+        run_ffmpeg(cmd, "decode")
+        tmp_path.replace(pcm_path)
+        info = {"files": [PCM_FILE], "params": fingerprint, "created": time.time()}
+        manifest.write_text(json.dumps(info, indent=2))
+        SplitCache(cache_dir, max_bytes).evict(keep=key)
+        return cls(pcm_path, sample_rate, channels)
+
+    # -- geometry ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.frames.shape[0]
+
+    @property
+    def duration(self) -> float:
+        """Length of the decoded audio in seconds."""
+        return len(self) / self.sample_rate
+
+    def view(self, start: float, end: float | None = None):
+        """Return a zero‑copy view between *start* and *end* seconds."""
+        first = max(0, round(start * self.sample_rate))
+        last = (
+            len(self) if end is None else min(len(self), round(end * self.sample_rate))
+        )
+        return self.frames[first:last]
+
+    def chunk_bounds(self, chunk: float) -> Iterator[Tuple[int, int]]:
+        """Yield sample‑accurate ``(first_frame, last_frame)`` pairs for *chunk* seconds."""
+        step = round(chunk * self.sample_rate)
+        if step <= 0:
+            fatal(f"Chunk length must be positive, got {chunk}")
+        for first in range(0, len(self), step):
+            yield first, min(first + step, len(self))
+
+    def chunks(self, chunk: float) -> Iterator:
+        """Yield zero‑copy views of consecutive *chunk*‑second windows."""
+        for first, last in self.chunk_bounds(chunk):
+            yield self.frames[first:last]
+
+
+# ---------------------------------------------------------------------------
+# Encoding views
+# ---------------------------------------------------------------------------
+
+
+def build_ffmpeg_encode_cmd(
+    outfile: Path,
+    enc: dict,
+    in_rate: int,
+    in_channels: int,
+    sample_rate: int,
+    channels: int,
+    bitrate: str | None,
+    verbose: bool,
+) -> List[str]:
+    """Return the FFmpeg command that encodes raw s16le from stdin to *outfile*."""
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        *([] if verbose else ["-loglevel", "error"]),
+        "-y",
+        "-f",
+        "s16le",
+        "-ar",
+        str(in_rate),
+        "-ac",
+        str(in_channels),
+        "-i",
+        "pipe:0",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        enc["codec"],
+    ]
+    if bitrate:
+        cmd += ["-b:a", bitrate]
+    cmd.append(str(outfile))
+    return cmd
+
+
+def write_wav(view, outfile: Path, sample_rate: int, channels: int) -> None:
+    """Write a PCM view to a WAV file without an intermediate copy."""
+    with wave.open(str(outfile), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(SAMPLE_WIDTH)
+        wf.setframerate(sample_rate)
+        wf.writeframes(memoryview(view).cast("B"))
+
+
+def encode_view(
+    view,
+    outfile: Path,
+    enc: dict,
+    in_rate: int,
+    in_channels: int,
+    sample_rate: int,
+    channels: int,
+    bitrate: str | None = None,
+    verbose: bool = False,
+) -> None:
+    """Encode a PCM view to *outfile* using codec entry *enc* (see ``CODEC_MAP``)."""
+    if enc["codec"] == "copy":
+        fatal("Codec 'copy' cannot be used with the PCM engine – pick a real codec.")
+
+    if (
+        enc["codec"] == "pcm_s16le"
+        and in_rate == sample_rate
+        and in_channels == channels
+    ):
+        write_wav(view, outfile, sample_rate, channels)
+        return
+
+    cmd = build_ffmpeg_encode_cmd(
+        outfile, enc, in_rate, in_channels, sample_rate, channels, bitrate, verbose
+    )
+    if verbose:
+        print("[ffmpeg]", " ".join(cmd))
+    run_ffmpeg(cmd, "encode", stdin_data=memoryview(view).cast("B"))
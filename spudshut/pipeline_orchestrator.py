@@ -4,14 +4,279 @@ Orchestrates the audio processing pipeline:
 - Watches for new input files.
 - Manages job status in the database.
 - Calls appropriate scripts for each processing stage.
+
+Live mode
+---------
+``live`` follows a recording that is still being written (see
+``audio_chunker split --follow``): every completed chunk is converted right
+away and appended to the output by an incremental join, so the converted
+file trails the recording by roughly one chunk plus API latency::
+
+    python -m spudshut.pipeline_orchestrator live session.wav \\
+        --voice Rachel --chunk 30 --output pipeline_output/session.mp3
 """
 from __future__ import annotations
 
-# TODO: Import necessary modules (e.g., time, Path, subprocess, db_operator)
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .audio_chunker import (
+    CODEC_MAP,
+    DEFAULT_CHANNELS,
+    DEFAULT_SAMPLE_RATE,
+    FOLLOW_IDLE_TIMEOUT_SECS,
+    IncrementalJoiner,
+    follow_split,
+)
+from .convert import (
+    DEFAULT_MODEL,
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_WORKERS,
+    convert_file,
+    create_client,
+    ext_from_output_format,
+    resolve_voice_id,
+)
+from .utils import check_ffmpeg, fatal
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROCESSING_DIR = PROJECT_ROOT / "pipeline_processing"
+OUTPUT_DIR = PROJECT_ROOT / "pipeline_output"
+LIVE_CHUNK_SECS = 30  # shorter chunks → lower lag, more API calls
+LIVE_OUTPUT_SAMPLE_RATE = 44_100
+LIVE_OUTPUT_CHANNELS = 1
+
+
+def codec_for_suffix(path: Path) -> str:
+    """Returns the CODEC_MAP key whose extension matches *path* (default wav)."""
+    for name, entry in CODEC_MAP.items():
+        if entry["ext"] == path.suffix.lower():
+            return name
+    return "wav"
+
+
+def run_live(
+    recording: Path,
+    voice: str,
+    output: Optional[Path] = None,
+    chunk: int = LIVE_CHUNK_SECS,
+    chunk_codec: Optional[str] = None,
+    out_codec: Optional[str] = None,
+    out_sample_rate: int = LIVE_OUTPUT_SAMPLE_RATE,
+    out_channels: int = LIVE_OUTPUT_CHANNELS,
+    out_bitrate: Optional[str] = None,
+    model: str = DEFAULT_MODEL,
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+    workers: int = DEFAULT_WORKERS,
+    idle_timeout: float = FOLLOW_IDLE_TIMEOUT_SECS,
+    api_key: Optional[str] = None,
+    verbose: bool = False,
+) -> Path:
+    """
+    Chunks, converts and joins a recording while it is still being written.
+
+    Chunks are produced by ``follow_split``, converted concurrently (up to
+    *workers* requests) and appended to the output strictly in order by an
+    ``IncrementalJoiner`` running on its own thread.
+
+    Returns:
+        Path: The finished output file.
+    """
+    job_identifier = f"{recording.stem}_live_{time.strftime('%Y%m%d%H%M%S')}"
+    job_dir = PROCESSING_DIR / job_identifier
+    chunks_dir = job_dir / "chunks"
+    converted_dir = job_dir / "converted_chunks"
+    converted_dir.mkdir(parents=True, exist_ok=True)
+    output = output or OUTPUT_DIR / f"{job_identifier}_final.wav"
+
+    client = create_client(api_key)
+    voice_id = resolve_voice_id(client, voice)
+    ext = ext_from_output_format(output_format)
+    joiner = IncrementalJoiner(
+        output,
+        out_codec or codec_for_suffix(output),
+        out_sample_rate,
+        out_channels,
+        out_bitrate,
+        verbose,
+    )
+
+    def convert(chunk_path: Path) -> Path:
+        out_path = converted_dir / (chunk_path.stem + ext)
+        convert_file(client, voice_id, chunk_path, out_path, model, output_format)
+        return out_path
+
+    # futures in chunk order; None marks the end of the recording
+    pending: "queue.Queue[Optional[Tuple[Future, float]]]" = queue.Queue()
+    errors: List[BaseException] = []
+    failed = threading.Event()  # stops follow_split and further uploads
+
+    def join_in_order() -> None:
+        while (item := pending.get()) is not None:
+            fut, ready_at = item
+            if errors:
+                continue  # drain after a failure
+            try:
+                converted = fut.result()
+                joiner.append(converted)
+            except BaseException as exc:  # includes fatal() from FFmpeg helpers
+                errors.append(exc)
+                failed.set()
+                continue
+            print(
+                f"  ↳ joined {converted.name} "
+                f"({time.monotonic() - ready_at:.1f}s after the chunk closed)",
+                flush=True,
+            )
+
+    join_thread = threading.Thread(target=join_in_order, daemon=True)
+    join_thread.start()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        try:
+            for chunk_path in follow_split(
+                recording,
+                chunks_dir,
+                chunk,
+                chunk_codec,
+                DEFAULT_SAMPLE_RATE,
+                DEFAULT_CHANNELS,
+                None,
+                verbose,
+                idle_timeout,
+                failed,
+            ):
+                if failed.is_set():
+                    break
+                print(f"  • {chunk_path.name}", flush=True)
+                pending.put((pool.submit(convert, chunk_path), time.monotonic()))
+        except BaseException:  # includes fatal() from follow_split
+            failed.set()
+            raise
+        finally:
+            pending.put(None)
+            join_thread.join()
+            if failed.is_set():
+                pool.shutdown(cancel_futures=True)  # queued chunks are not uploaded
+
+    joiner.close()
+    if errors:
+        fatal(f"Live conversion stopped: {errors[0]}")
+    print(f"✅ Live job {job_identifier}: {joiner.count} chunk(s) → {output.resolve()}")
+    return output
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pipeline_orchestrator.py",
+        description="Run the audio processing pipeline.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    p_live = sub.add_parser(
+        "live",
+        help="Convert a recording that is still being written, chunk by chunk",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    p_live.add_argument("recording", type=Path, help="Growing input file")
+    p_live.add_argument("--voice", required=True, help="Target voice name or ID")
+    p_live.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Joined output file (default: pipeline_output/<job>_final.wav)",
+    )
+    p_live.add_argument(
+        "-c",
+        "--chunk",
+        type=int,
+        default=LIVE_CHUNK_SECS,
+        metavar="SECONDS",
+        help="Chunk length; the output lags the recording by about this much",
+    )
+    p_live.add_argument(
+        "--chunk-codec",
+        choices=[c for c in CODEC_MAP if c != "copy"],
+        help="Codec of the uploaded chunks (default: flac)",
+    )
+    p_live.add_argument(
+        "--codec",
+        choices=[c for c in CODEC_MAP if c != "copy"],
+        help="Output codec (default: inferred from the output extension)",
+    )
+    p_live.add_argument(
+        "--sr",
+        "--sample-rate",
+        type=int,
+        default=LIVE_OUTPUT_SAMPLE_RATE,
+        help="Output sample rate in Hz",
+    )
+    p_live.add_argument(
+        "--ch",
+        "--channels",
+        type=int,
+        default=LIVE_OUTPUT_CHANNELS,
+        help="Output channels",
+    )
+    p_live.add_argument("--bitrate", help="Output bit‑rate for lossy codecs")
+    p_live.add_argument("--model", default=DEFAULT_MODEL, help="Model ID to use")
+    p_live.add_argument(
+        "--output-format",
+        default=DEFAULT_OUTPUT_FORMAT,
+        help="ElevenLabs output_format string",
+    )
+    p_live.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Concurrent conversions",
+    )
+    p_live.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=FOLLOW_IDLE_TIMEOUT_SECS,
+        metavar="SECONDS",
+        help="Recording is finished after this long without growth",
+    )
+    p_live.add_argument(
+        "--api-key", help="Explicit ElevenLabs API key (else env ELEVENLABS_API_KEY)"
+    )
+    p_live.add_argument(
+        "-v", "--verbose", action="store_true", help="Show FFmpeg output"
+    )
+    return parser
 
 
 def main():
     """Main loop for the pipeline orchestrator."""
+    args = build_parser().parse_args()
+
+    if args.command == "live":
+        check_ffmpeg()
+        run_live(
+            args.recording,
+            args.voice,
+            output=args.output,
+            chunk=args.chunk,
+            chunk_codec=args.chunk_codec,
+            out_codec=args.codec,
+            out_sample_rate=args.sr,
+            out_channels=args.ch,
+            out_bitrate=args.bitrate,
+            model=args.model,
+            output_format=args.output_format,
+            workers=args.workers,
+            idle_timeout=args.idle_timeout,
+            api_key=args.api_key,
+            verbose=args.verbose,
+        )
+        return
+
     # print("Pipeline Orchestrator starting...")
     # TODO: Initialize database connection/operator
     # TODO: Implement main loop:
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+report.py — throughput and latency report from the job database.
+
+Every status change made through ``db_operator`` is appended to the
+``stage_events`` table.  This CLI aggregates those events over a time window:
+
+* audio‑hours completed per hour (or ``--bucket``)
+* per‑stage service time p50/p95 (CHUNKING → CHUNKED, …)
+* queue wait before each stage (CHUNKED → CONVERTING, …)
+* conversion‑stage wall seconds per audio second, and API seconds per audio
+  second over the conversions that recorded their request time
+* error rate per stage (ERROR after X‑ING / X‑ING events)
+
+All aggregates are index‑only range scans over ``(status, event_time, …)``,
+so the window size — not the table size — bounds the cost.  Each event
+carries the job's audio duration, taken from ``processing_jobs.audio_seconds``
+or, failing that, the ``media_index`` entry for the job's input file.
+
+Usage
+-----
+    python -m spudshut.report                       # last 24 hours
+    python -m spudshut.report --since 7d --bucket 1d
+    python -m spudshut.report --since 2025-06-01 --until 2025-06-08 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from . import db_operator
+from .utils import fatal
+
+# stage: (status it waits in, in‑progress status, done status)
+STAGES = {
+    "chunk": ("NEW", "CHUNKING", "CHUNKED"),
+    "convert": ("CHUNKED", "CONVERTING", "CONVERTED"),
+    "join": ("CONVERTED", "JOINING", "COMPLETED"),
+}
+DEFAULT_SINCE = "24h"
+DEFAULT_BUCKET = "1h"
+UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86_400, "w": 604_800}
+
+
+def parse_span(value: str) -> int:
+    """'90s', '15m', '1h', '7d', '2w' → seconds."""
+    m = re.fullmatch(r"(\d+)([smhdw])", value.strip().lower())
+    if not m or int(m.group(1)) == 0:
+        raise argparse.ArgumentTypeError(f"invalid duration: {value!r} (e.g. 1h, 7d)")
+    return int(m.group(1)) * UNIT_SECONDS[m.group(2)]
+
+
+def parse_time(value: str) -> float:
+    """'now', a span back from now ('24h'), or an ISO date/time (local) → epoch."""
+    if value == "now":
+        return time.time()
+    if re.fullmatch(r"\d+[smhdw]", value.strip().lower()):
+        return time.time() - parse_span(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid time: {value!r} (use now, 24h, 7d or YYYY-MM-DD[THH:MM])"
+        ) from None
+
+
+def ratio(num: float, den: float) -> Optional[float]:
+    return num / den if den else None
+
+
+def build_report(since: float, until: float, bucket: int) -> Dict[str, Any]:
+    """Returns all aggregates for [since, until) as a JSON‑serialisable dict."""
+    throughput = db_operator.audio_throughput(since, until, bucket)
+    stages: Dict[str, Any] = {}
+    for name, (queued, running, done) in STAGES.items():
+        started = db_operator.count_transitions(running, None, since, until)
+        errors = db_operator.count_transitions("ERROR", running, since, until)
+        stages[name] = {
+            "started": started,
+            "errors": errors,
+            "error_rate": ratio(errors, started),
+            "service": db_operator.transition_durations(done, running, since, until),
+            "queue_wait": db_operator.transition_durations(
+                running, queued, since, until
+            ),
+        }
+
+    _, converting, converted = STAGES["convert"]
+    work = db_operator.stage_audio_seconds(converted, converting, since, until)
+    return {
+        "since": since,
+        "until": until,
+        "bucket_seconds": bucket,
+        "throughput": [
+            {**row, "audio_hours": row["audio_seconds"] / 3600} for row in throughput
+        ],
+        "audio_hours": sum(r["audio_seconds"] for r in throughput) / 3600,
+        "stages": stages,
+        "convert_seconds_per_audio_second": ratio(work["elapsed"], work["audio"]),
+        "api_seconds_per_audio_second": ratio(work["api"], work["api_audio"]),
+        "api_timed_conversions": work["api_count"],
+        "conversions": work["count"],
+    }
+
+
+def fmt_secs(value: Optional[float]) -> str:
+    if value is None:
+        return "—"
+    if value < 120:
+        return f"{value:.1f}s"
+    if value < 7200:
+        return f"{value / 60:.1f}m"
+    return f"{value / 3600:.1f}h"
+
+
+def fmt_pct(value: Optional[float]) -> str:
+    return "—" if value is None else f"{value:.1%}"
+
+
+def fmt_ratio(value: Optional[float]) -> str:
+    return "—" if value is None else f"{value:.3f}"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    def stamp(t: float) -> str:
+        return datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M")
+
+    print(f"Window {stamp(report['since'])} → {stamp(report['until'])}")
+    print(f"\nAudio completed: {report['audio_hours']:.2f} h")
+    for row in report["throughput"]:
+        print(
+            f"  {stamp(row['bucket_start'])}  {row['jobs']:>5} job(s)"
+            f"  {row['audio_hours']:8.2f} h"
+        )
+
+    header = (
+        f"{'stage':<8} {'started':>7} {'errors':>6} {'err %':>6}  "
+        f"{'service p50':>11} {'p95':>7}  {'wait p50':>8} {'p95':>7}"
+    )
+    print(f"\n{header}\n{'-' * len(header)}")
+    for name, s in report["stages"].items():
+        svc, wait = s["service"], s["queue_wait"]
+        print(
+            f"{name:<8} {s['started']:>7} {s['errors']:>6} {fmt_pct(s['error_rate']):>6}  "
+            f"{fmt_secs(svc['p50']):>11} {fmt_secs(svc['p95']):>7}  "
+            f"{fmt_secs(wait['p50']):>8} {fmt_secs(wait['p95']):>7}"
+        )
+
+    print(
+        "\nConvert stage seconds per audio second: "
+        + fmt_ratio(report["convert_seconds_per_audio_second"])
+    )
+    print(
+        "API seconds per audio second: "
+        + fmt_ratio(report["api_seconds_per_audio_second"])
+        + f" ({report['api_timed_conversions']} of {report['conversions']}"
+        " conversion(s) recorded API time)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="report.py",
+        description="Report pipeline throughput, stage latency and error rates.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--since",
+        default=DEFAULT_SINCE,
+        help="Window start: span back from now (24h, 7d) or ISO date/time",
+    )
+    parser.add_argument(
+        "--until", default="now", help="Window end: now, span back or ISO date/time"
+    )
+    parser.add_argument(
+        "--bucket",
+        default=DEFAULT_BUCKET,
+        help="Throughput bucket size (e.g. 15m, 1h, 1d)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+    try:
+        since, until = parse_time(args.since), parse_time(args.until)
+        bucket = parse_span(args.bucket)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+    if since >= until:
+        fatal("--since must be earlier than --until")
+    if not db_operator.DATABASE_FILE.exists():
+        fatal(f"Job database not found: {db_operator.DATABASE_FILE}")
+
+    db_operator.initialize_database()
+    report = build_report(since, until, bucket)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
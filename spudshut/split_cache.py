@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Content‑addressed cache of chunk sets produced by the splitters.
+
+A cache key is the SHA‑256 of the input file's *content* combined with the
+split parameters (splitter, chunk length, codec, sample rate, channels,
+bit‑rate, …).  On a hit the cached chunks are hard‑linked into the requested
+output directory (falling back to a copy across filesystems), so re‑running a
+job or retrying a conversion skips the FFmpeg split entirely.
+
+Chunks are *copied* into the cache, never linked, and the splitters unlink
+existing ``<stem>_NNN`` chunks (``clear_chunks``) before writing new ones: the
+segment muxer and the PCM engine truncate and rewrite existing files in place,
+which would otherwise write through a hard link into a cache entry.
+
+Layout::
+
+    pipeline_data/split_cache/<key>/manifest.json
+    pipeline_data/split_cache/<key>/000.flac, 001.flac, ...
+
+The cache is bounded by total size; least‑recently‑used entries (manifest
+mtime, refreshed on every hit) are evicted first.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_CACHE_DIR = (
+    Path(__file__).resolve().parent.parent / "pipeline_data" / "split_cache"
+)
+DEFAULT_MAX_BYTES = 5 * 1024**3  # 5 GiB
+MANIFEST = "manifest.json"
+
+
+def file_digest(path: Path) -> str:
+    """Return the hex SHA‑256 of a file's content."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hard‑link *src* to *dst*, copying instead if linking is not possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def clear_chunks(outdir: Path, stem: str) -> None:
+    """Unlink existing ``<stem>_NNN.<ext>`` chunks in *outdir* before a re‑split."""
+    if not outdir.is_dir():
+        return
+    pattern = re.compile(rf"{re.escape(stem)}_\d{{3,}}\.[^.]+")
+    for p in outdir.iterdir():
+        if pattern.fullmatch(p.name):
+            p.unlink(missing_ok=True)
+
+
+class SplitCache:
+    """A size‑bounded, content‑addressed store of chunk sets."""
+
+    def __init__(
+        self, root: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def key(self, infile: Path, **params) -> str:
+        """Return the cache key for *infile* split with *params*."""
+        payload = {"input_sha256": file_digest(infile), **params}
+        blob = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(blob).hexdigest()
+
+    def restore(self, key: str, outdir: Path, stem: str) -> Optional[List[Path]]:
+        """Link a cached chunk set into *outdir* as ``<stem>_NNN<ext>``.
+
+        Existing ``<stem>_NNN`` chunks in *outdir* are removed first, so a
+        shorter set never leaves stale chunks of an earlier split behind.
+        Returns the restored paths, or None on a miss.
+        """
+        entry = self.root / key
+        try:
+            manifest = json.loads((entry / MANIFEST).read_text())
+        except (OSError, ValueError):
+            return None
+
+        files = [entry / name for name in manifest["files"]]
+        if not all(p.is_file() for p in files):
+            shutil.rmtree(entry, ignore_errors=True)  # damaged entry
+            return None
+
+        clear_chunks(outdir, stem)
+        outdir.mkdir(parents=True, exist_ok=True)
+        restored = []
+        for i, src in enumerate(files):
+            dst = outdir / f"{stem}_{i:03d}{src.suffix}"
+            link_or_copy(src, dst)
+            restored.append(dst)
+        os.utime(entry / MANIFEST)  # mark as recently used
+        return restored
+
+    def store(self, key: str, chunks: List[Path], params: dict | None = None) -> None:
+        """Add a freshly split chunk set to the cache, then evict to size."""
+        entry = self.root / key
+        if (entry / MANIFEST).is_file():
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+
+        names = []
+        for i, src in enumerate(chunks):
+            name = f"{i:03d}{src.suffix}"
+            shutil.copyfile(src, staging / name)  # own inode, see module docs
+            names.append(name)
+        manifest = {"files": names, "params": params or {}, "created": time.time()}
+        (staging / MANIFEST).write_text(json.dumps(manifest, indent=2, default=str))
+
+        try:
+            staging.rename(entry)
+        except OSError:  # another process stored the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> None:
+        """Remove least‑recently‑used entries until the cache fits ``max_bytes``."""
+        if not self.root.is_dir():
+            return
+        entries = []
+        total = 0
+        for entry in self.root.iterdir():
+            manifest = entry / MANIFEST
+            if not entry.is_dir() or not manifest.is_file():
+                continue
+            size = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+            entries.append((manifest.stat().st_mtime, size, entry))
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """Add the split‑cache options shared by both splitters."""
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of the content‑addressed split cache",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help="Evict least‑recently‑used cache entries beyond this total size",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always re‑split; bypass the cache"
+    )
+
+
+def cache_from_args(args: argparse.Namespace) -> SplitCache | None:
+    """Return the SplitCache configured on the command line, or None if disabled."""
+    if args.no_cache:
+        return None
+    return SplitCache(args.cache_dir, args.cache_max_bytes)
@@ -0,0 +1,12 @@
+"""Start-up guard: entry modules must not import heavy dependencies at load time.
+
+Only the FORBIDDEN check runs here; the millisecond budget depends on the
+machine and stays with ``python -m spudshut.bench_startup``.
+"""
+from spudshut.bench_startup import ENTRY_MODULES, bench
+
+
+def test_entry_modules_do_not_import_heavy_dependencies():
+    results = bench(ENTRY_MODULES, runs=1)
+    heavy = {mod: sorted(pkgs) for mod, (_, pkgs) in results.items() if pkgs}
+    assert heavy == {}
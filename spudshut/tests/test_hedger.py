@@ -0,0 +1,70 @@
+"""Tests for convert.Hedger with a fake ``attempt`` callable in place of the
+ElevenLabs request."""
+import threading
+import time
+
+import pytest
+
+from spudshut.convert import Hedger
+
+
+def _warm(hedger: Hedger) -> None:
+    """Record one fast latency so the hedge threshold is known (near zero)."""
+    assert hedger.run(lambda cancel: b"warm") == b"warm"
+
+
+def test_hung_primary_is_hedged_and_twin_wins():
+    hedger = Hedger(total_tasks=4, percentile=50, budget=0.5, min_samples=1)
+    _warm(hedger)
+    calls = []
+    primary_cancelled = threading.Event()
+
+    def attempt(cancel: threading.Event) -> bytes:
+        calls.append(cancel)
+        if len(calls) == 1:  # primary hangs until the winner cancels it
+            if cancel.wait(timeout=5):
+                primary_cancelled.set()
+            return b"primary"
+        return b"twin"
+
+    started = time.monotonic()
+    assert hedger.run(attempt) == b"twin"
+    assert time.monotonic() - started < 2
+    assert len(calls) == 2
+    assert hedger.wins == 1
+    assert hedger.extra == 1
+    assert primary_cancelled.wait(timeout=1)
+
+
+def test_error_without_twin_reraises():
+    hedger = Hedger(total_tasks=1, budget=0)
+
+    def attempt(cancel: threading.Event) -> bytes:
+        raise RuntimeError("upload failed")
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        hedger.run(attempt)
+    assert hedger.extra == 0
+    assert hedger.wins == 0
+
+
+def test_duplicates_stay_within_budget():
+    # a 1st-percentile threshold stays at the warm-up latency, so every
+    # slow task would be hedged if the budget allowed it
+    hedger = Hedger(total_tasks=4, percentile=1, budget=0.5, min_samples=1)
+    assert hedger.max_extra == 2
+    _warm(hedger)
+    calls = []
+    lock = threading.Lock()
+
+    def slow(cancel: threading.Event) -> bytes:
+        with lock:
+            calls.append(cancel)
+        cancel.wait(timeout=0.05)
+        return b"ok"
+
+    for _ in range(4):
+        assert hedger.run(slow) == b"ok"
+    assert hedger.extra == hedger.max_extra
+    # four primaries plus one twin each for the first two tasks only
+    assert len(calls) == 4 + hedger.max_extra
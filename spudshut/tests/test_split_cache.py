@@ -0,0 +1,92 @@
+"""Regression tests for split_cache: cache entries must not share inodes with
+chunks that a later split rewrites in place."""
+from pathlib import Path
+
+from spudshut.split_cache import SplitCache, clear_chunks
+
+
+def _split(outdir: Path, stem: str, payloads: list[bytes]) -> list[Path]:
+    """Write chunks the way FFmpeg's segment muxer does: open existing files
+    with truncation and write into them."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    chunks = []
+    for i, data in enumerate(payloads):
+        path = outdir / f"{stem}_{i:03d}.flac"
+        with path.open("wb") as f:
+            f.write(data)
+        chunks.append(path)
+    return chunks
+
+
+def test_store_copies_chunks(tmp_path):
+    infile = tmp_path / "in.wav"
+    infile.write_bytes(b"source")
+    cache = SplitCache(tmp_path / "cache")
+    outdir = tmp_path / "in_chunks"
+
+    k240 = cache.key(infile, chunk=240)
+    cache.store(k240, _split(outdir, "in", [b"240-a", b"240-b"]), {"chunk": 240})
+
+    # --no-cache re-split into the same directory, without clearing first
+    _split(outdir, "in", [b"120-a"])
+
+    restored = cache.restore(k240, tmp_path / "again", "in")
+    assert [p.read_bytes() for p in restored] == [b"240-a", b"240-b"]
+
+
+def test_resplit_after_restore_keeps_cache_intact(tmp_path):
+    infile = tmp_path / "in.wav"
+    infile.write_bytes(b"source")
+    cache = SplitCache(tmp_path / "cache")
+    outdir = tmp_path / "in_chunks"
+
+    k240 = cache.key(infile, chunk=240)
+    cache.store(k240, _split(outdir, "in", [b"240-a", b"240-b"]), {"chunk": 240})
+    assert cache.restore(k240, outdir, "in")  # out/ now links to the entry
+
+    # -c 120 re-split into the same <stem>_chunks directory
+    clear_chunks(outdir, "in")
+    k120 = cache.key(infile, chunk=120)
+    cache.store(k120, _split(outdir, "in", [b"120-a"]), {"chunk": 120})
+
+    assert sorted(p.name for p in outdir.iterdir()) == ["in_000.flac"]
+    assert [p.read_bytes() for p in cache.restore(k240, outdir, "in")] == [
+        b"240-a",
+        b"240-b",
+    ]
+    assert [p.read_bytes() for p in cache.restore(k120, tmp_path / "b", "in")] == [
+        b"120-a"
+    ]
+
+
+def test_restore_shorter_set_removes_stale_chunks(tmp_path):
+    infile = tmp_path / "in.wav"
+    infile.write_bytes(b"source")
+    cache = SplitCache(tmp_path / "cache")
+    outdir = tmp_path / "in_chunks"
+
+    k240 = cache.key(infile, chunk=240)
+    cache.store(k240, _split(tmp_path / "a", "in", [b"240-a", b"240-b"]), {})
+    # an earlier 120 s split left four chunks in the output directory
+    _split(outdir, "in", [b"120-a", b"120-b", b"120-c", b"120-d"])
+
+    restored = cache.restore(k240, outdir, "in")
+    assert sorted(p.name for p in outdir.iterdir()) == ["in_000.flac", "in_001.flac"]
+    assert [p.read_bytes() for p in restored] == [b"240-a", b"240-b"]
+
+
+def test_clear_chunks_only_removes_numbered_chunks(tmp_path):
+    for name in (
+        "in_000.flac",
+        "in_1234.wav",
+        "in_notes.txt",
+        "in.flac",
+        ".in_001.flac.tmp",
+    ):
+        (tmp_path / name).write_bytes(b"x")
+    clear_chunks(tmp_path, "in")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        ".in_001.flac.tmp",
+        "in.flac",
+        "in_notes.txt",
+    ]
@@ -4,9 +4,12 @@ Shared utility functions for SpudShut audio processing scripts.
 """
 from __future__ import annotations
 
+import json
+import subprocess
 import sys
 import shutil
-from typing import NoReturn
+from pathlib import Path
+from typing import List, NoReturn
 
 
 def fatal(msg: str) -> NoReturn:
@@ -32,5 +35,101 @@ def check_ffmpeg() -> None:
         fatal("FFmpeg executable not found – install it and ensure it's on PATH.")
 
 
+def run_ffmpeg(
+    cmd: List[str], label: str, stdin_data: bytes | memoryview | None = None
+) -> subprocess.CompletedProcess:
+    """
+    Runs an FFmpeg/FFprobe command, calling fatal() with its stderr on failure.
+
+    Args:
+        cmd (List[str]): The full command line.
+        label (str): Short stage name used in the error message (e.g. "split").
+        stdin_data (bytes | memoryview | None): Optional data fed to stdin.
+
+    Returns:
+        subprocess.CompletedProcess: The finished process; stdout is bytes.
+    """
+    try:
+        return subprocess.run(cmd, check=True, capture_output=True, input=stdin_data)
+    except subprocess.CalledProcessError as exc:
+        stderr = exc.stderr.decode(errors="replace").strip() if exc.stderr else ""
+        error_message = f"FFmpeg command ({label}) failed (exit code {exc.returncode})."
+        error_message += f"\nCommand: {' '.join(exc.cmd)}"
+        if stderr:
+            error_message += f"\nFFmpeg stderr:\n{stderr}"
+        else:
+            error_message += "\nFFmpeg stderr: (No output captured or empty)."
+        error_message += (
+            "\nTip: Rerun with -v for full FFmpeg log output during execution."
+        )
+        fatal(error_message)
+    except FileNotFoundError:
+        fatal(
+            f"FFmpeg command not found. Ensure FFmpeg is installed and in your PATH. Command: {' '.join(cmd)}"
+        )
+
+
+def probe_audio(path: Path, strict: bool = True) -> dict:
+    """
+    Reads the first audio stream's codec, sample rate, channels and duration via ffprobe.
+
+    Args:
+        path (Path): The audio file to inspect.
+        strict (bool): Call fatal() if ffprobe fails or there is no audio stream.
+            If False, such files yield ``{"error": message}`` instead (used by
+            the media index, which records unreadable files).
+
+    Returns:
+        dict: Keys ``codec_name``, ``sample_rate``, ``channels``, ``duration``
+        (seconds, float; numbers are 0 when unknown), ``bit_rate`` (stream,
+        else container; None when unknown), ``format_name`` and ``error``
+        (None).
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=codec_name,sample_rate,channels,bit_rate"
+        ":format=duration,bit_rate,format_name",
+        "-of",
+        "json",
+        str(path),
+    ]
+    if strict:
+        stdout = run_ffmpeg(cmd, "probe").stdout
+    else:
+        try:
+            proc = subprocess.run(cmd, capture_output=True)
+        except FileNotFoundError:
+            fatal(
+                "ffprobe executable not found – install FFmpeg and ensure it's on PATH."
+            )
+        if proc.returncode != 0:
+            stderr = proc.stderr.decode(errors="replace").strip()
+            return {"error": stderr or f"ffprobe exit {proc.returncode}"}
+        stdout = proc.stdout
+
+    data = json.loads(stdout or b"{}")
+    streams = data.get("streams") or []
+    if not streams:
+        if strict:
+            fatal(f"No audio stream found in {path}")
+        return {"error": "no audio stream"}
+    stream, fmt = streams[0], data.get("format", {})
+    bit_rate = stream.get("bit_rate") or fmt.get("bit_rate")
+    return {
+        "codec_name": stream.get("codec_name"),
+        "sample_rate": int(stream.get("sample_rate") or 0),
+        "channels": int(stream.get("channels") or 0),
+        "duration": float(fmt.get("duration") or 0.0),
+        "bit_rate": int(bit_rate) if bit_rate else None,
+        "format_name": fmt.get("format_name"),
+        "error": None,
+    }
+
+
 # Shared constants
 CHUNK_DEFAULT_SECS = 240  # Default chunk length in seconds (4 minutes)